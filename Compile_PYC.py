@@ -1,10 +1,14 @@
 from __future__ import annotations
 import argparse
+import contextlib
+import os
 import shutil
 import sys
 import py_compile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 DEFAULT_ROOTS = [
     "FedPro",
@@ -14,6 +18,26 @@ DEFAULT_ROOTS = [
     "SimpleFedPro",
 ]
 
+# Directory names (lower-case) never descended into while collecting sources
+_IGNORED_DIRS = frozenset({"__pycache__", "bin", "scripts", "include", "lib", "site-packages"})
+
+# Success lines are written to stdout in batches of this many rather than one print per file
+_OUTPUT_BATCH = 64
+
+# CLI spelling -> py_compile invalidation mode
+_INVALIDATION_MODES = {
+    "timestamp": py_compile.PycInvalidationMode.TIMESTAMP,
+    "checked-hash": py_compile.PycInvalidationMode.CHECKED_HASH,
+    "unchecked-hash": py_compile.PycInvalidationMode.UNCHECKED_HASH,
+}
+
+# py_compile invalidation mode -> flags word stored in bytes 4-8 of the pyc header (PEP 552)
+_PYC_FLAGS = {
+    py_compile.PycInvalidationMode.TIMESTAMP: b"\x00\x00\x00\x00",
+    py_compile.PycInvalidationMode.UNCHECKED_HASH: b"\x01\x00\x00\x00",
+    py_compile.PycInvalidationMode.CHECKED_HASH: b"\x03\x00\x00\x00",
+}
+
 """Compile project Python sources to .pyc under a dedicated bin tree.
 
 Creates a mirror of the selected source package directories inside
@@ -27,6 +51,9 @@ Usage examples:
     python compile_pyc.py -O 1           (optimize: strip asserts)
     python compile_pyc.py -O 2           (optimize: strip asserts + docstrings)
     python compile_pyc.py --roots FedPro HLA_bounce
+    python compile_pyc.py --invalidation timestamp   (mtime-based pyc validation)
+    python compile_pyc.py --force        (recompile even if pyc is up to date)
+    python compile_pyc.py -j 1           (compile serially in this process)
 
 Exit code: 0 on success, 1 if any file failed to compile.
 """
@@ -34,86 +61,165 @@ Exit code: 0 on success, 1 if any file failed to compile.
 def parse_args() -> argparse.Namespace:
     # Description: Parse command-line arguments controlling compilation behavior.
     # Inputs: Reads from sys.argv implicitly (argparse).
-    # Outputs: argparse.Namespace with attributes: roots (list[str]), clean (bool), opt (int), quiet (bool).
+    # Outputs: argparse.Namespace with attributes: roots (list[str]), clean (bool), opt (int), quiet (bool), invalidation (str), force (bool), workers (int).
     # Exceptions: SystemExit on invalid arguments (argparse default behavior).
     parser = argparse.ArgumentParser(description="Compile project sources to .pyc under ./bin")
     parser.add_argument("--roots", nargs="*", default=DEFAULT_ROOTS, help="Root subdirectories to include")
     parser.add_argument("--clean", action="store_true", help="Remove existing bin directory before compiling")
     parser.add_argument("-O", "--opt", type=int, choices=(0, 1, 2), default=0, help="Optimization level (matches python -O / -OO)")
     parser.add_argument("--quiet", action="store_true", help="Reduce output (only errors + summary)")
+    parser.add_argument("--invalidation", choices=tuple(_INVALIDATION_MODES), default="checked-hash",
+                        help="pyc invalidation mode (default: checked-hash, immune to mtime rewrites)")
+    parser.add_argument("--force", action="store_true", help="Recompile every source even if its pyc looks up to date")
+    parser.add_argument("-j", "--workers", type=int, default=0,
+                        help="Worker processes (0 = one per CPU, 1 = serial; matches compileall -j)")
     return parser.parse_args()
 
 
-def compute_pyc_name(source: Path, opt: int) -> str:
-    """Return canonical pycache file name for a module."""
-    # Description: Build standardized .pyc filename including interpreter cache tag and optimization level.
+def _pyc_suffix(opt: int) -> str:
+    # Description: Build the .pyc filename suffix (interpreter cache tag + optimization level), computed once per run.
     # Inputs:
-    #   source (Path): Source .py file path.
     #   opt (int): Optimization level (0,1,2).
-    # Outputs: str filename (no directory portion).
+    # Outputs: str suffix such as ".cpython-313.pyc" or ".cpython-313.opt-1.pyc".
     # Exceptions: None.
     tag = sys.implementation.cache_tag or "cpython"
     opt_tag = "" if opt == 0 else f".opt-{opt}"
-    return f"{source.stem}.{tag}{opt_tag}.pyc"
+    return f".{tag}{opt_tag}.pyc"
+
+
+def _is_fresh(source: str, cfile: str, flags: bytes) -> bool:
+    # Description: Cheap up-to-date test so unchanged sources never reach py_compile (which always rewrites).
+    # Inputs:
+    #   source (str): Source .py file path.
+    #   cfile (str): Destination .pyc path.
+    #   flags (bytes): Expected pyc header flags word for the requested invalidation mode (see _PYC_FLAGS).
+    # Outputs: bool True if cfile exists, holds more than a bare header, is at least as new as source and
+    #   was written with the requested invalidation mode (so a mode change recompiles without --force).
+    # Exceptions: None; a missing or unreadable cfile or source counts as stale.
+    try:
+        cst = os.stat(cfile)
+        if cst.st_size <= 16 or cst.st_mtime_ns < os.stat(source).st_mtime_ns:
+            return False
+        with open(cfile, "rb") as pyc:
+            return pyc.read(8)[4:] == flags
+    except OSError:
+        return False
 
 
-def should_skip(path: Path) -> bool:
-    # Description: Determine whether a path should be excluded from compilation.
+def _compile_one(job: tuple[str, str, str, int, py_compile.PycInvalidationMode]) -> tuple[str, str | None]:
+    # Description: Worker entry point compiling a single source file (runs in a pool process).
     # Inputs:
-    #   path (Path): Candidate file path.
-    # Outputs: bool True if path resides in ignored directories or hidden.
-    # Exceptions: None
-    parts = path.parts
-    # Skip virtual envs, bin outputs, hidden dirs
-    return any(
-        p.startswith(".") or p.lower() in {"__pycache__", "bin", "scripts", "include", "lib", "site-packages"}
-        for p in parts
-    )
-
-
-def compile_tree(base: Path, roots: list[str], out_root: Path, opt: int, quiet: bool) -> int:
-    # Description: Recursively compile all .py files under specified roots into mirrored bin/__pycache__ tree.
+    #   job (tuple): (source path, cfile destination, dfile recorded in pyc, optimization level, invalidation mode).
+    # Outputs: tuple (dfile, error text or None on success).
+    # Exceptions: None; py_compile and OSError failures are returned to the driver as text.
+    source, cfile, dfile, opt, mode = job
+    try:
+        py_compile.compile(
+            source,
+            cfile=cfile,
+            dfile=dfile,  # recorded path inside pyc (relative)
+            doraise=True,
+            optimize=opt,
+            invalidation_mode=mode,
+        )
+        return dfile, None
+    except (py_compile.PyCompileError, OSError) as e:
+        return dfile, str(e)
+
+
+def iter_jobs(base: Path, roots: list[str], out_root: Path, opt: int, quiet: bool,
+              mode: py_compile.PycInvalidationMode, force: bool = False) -> Iterator[tuple[str, str, str, int, py_compile.PycInvalidationMode]]:
+    # Description: Walk the selected roots and yield one compile job per out-of-date .py file, creating each cache dir once.
     # Inputs:
     #   base (Path): Project base directory (script location).
     #   roots (list[str]): Top-level subdirectories to traverse.
     #   out_root (Path): Destination root where bin tree resides.
     #   opt (int): Optimization level passed to py_compile.
-    #   quiet (bool): If True, suppress per-file success output.
-    # Outputs: int number of files that failed to compile (error count).
-    # Exceptions: Unexpected exceptions propagate; py_compile and OSError handled per file.
-    errors = 0
-    total = 0
-    start = time.time()
-
+    #   quiet (bool): If True, suppress missing-root warnings.
+    #   mode (PycInvalidationMode): Invalidation mode recorded in each pyc.
+    #   force (bool): If True, yield every source regardless of pyc freshness.
+    # Outputs: Iterator of (source, cfile, dfile, opt, mode) tuples consumed by _compile_one.
+    # Exceptions: OSError from mkdir propagates.
+    suffix = _pyc_suffix(opt)
+    flags = _PYC_FLAGS[mode]
     for root in roots:
         src_root = base / root
         if not src_root.exists():
             if not quiet:
                 print(f"[WARN] Skipping missing root {src_root}")
             continue
-        for py in src_root.rglob("*.py"):
-            if should_skip(py):
+        for dirpath, dirnames, filenames in os.walk(src_root):
+            # Prune hidden / ignored directories in place so os.walk never descends into them
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d.lower() not in _IGNORED_DIRS]
+            sources = [name for name in filenames if name.endswith(".py") and not name.startswith(".")]
+            if not sources:
                 continue
-            rel = py.relative_to(base)
-            target_pkg_dir = out_root / rel.parent
-            cache_dir = target_pkg_dir / "__pycache__"
+            # One mkdir per directory (not per file); runs in the driver before any work is dispatched
+            rel_dir = Path(dirpath).relative_to(base)
+            cache_dir = out_root / rel_dir / "__pycache__"
             cache_dir.mkdir(parents=True, exist_ok=True)
-            pyc_name = compute_pyc_name(py, opt)
-            cfile = cache_dir / pyc_name
-            try:
-                py_compile.compile(
-                    str(py),
-                    cfile=str(cfile),
-                    dfile=str(rel),  # recorded path inside pyc (relative)
-                    optimize=opt,
-                    invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP,
-                )
-                total += 1
+            # Per-directory string prefixes so each file costs only concatenations, no Path arithmetic
+            src_prefix = dirpath + os.sep
+            rel_prefix = f"{rel_dir}{os.sep}"
+            cache_prefix = f"{cache_dir}{os.sep}"
+            for name in sources:
+                source = src_prefix + name
+                cfile = cache_prefix + name[:-3] + suffix
+                if not force and _is_fresh(source, cfile, flags):
+                    continue
+                yield source, cfile, rel_prefix + name, opt, mode
+
+
+def compile_tree(base: Path, roots: list[str], out_root: Path, opt: int, quiet: bool,
+                 mode: py_compile.PycInvalidationMode = py_compile.PycInvalidationMode.CHECKED_HASH,
+                 force: bool = False, workers: int = 0) -> int:
+    # Description: Compile all .py files under specified roots into mirrored bin/__pycache__ tree, optionally in a process pool.
+    # Inputs:
+    #   base (Path): Project base directory (script location).
+    #   roots (list[str]): Top-level subdirectories to traverse.
+    #   out_root (Path): Destination root where bin tree resides.
+    #   opt (int): Optimization level passed to py_compile.
+    #   quiet (bool): If True, suppress per-file success output.
+    #   mode (PycInvalidationMode): Invalidation mode recorded in each pyc.
+    #   force (bool): If True, recompile sources whose pyc is already up to date.
+    #   workers (int): Worker process count; 0 means os.cpu_count(), 1 compiles serially in-process.
+    # Outputs: int number of files that failed to compile (error count).
+    # Exceptions: Unexpected exceptions propagate; py_compile and OSError handled per file in the workers.
+    errors = 0
+    total = 0
+    start = time.time()
+    out_buf: list[str] = []
+
+    # Collect work up front so directory creation stays in the driver process
+    jobs = list(iter_jobs(base, roots, out_root, opt, quiet, mode, force))
+    base_prefix = f"{base}{os.sep}"
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    # Skip pool start-up entirely when there is nothing to spread across processes
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) > 1 else None
+    with executor or contextlib.nullcontext():
+        if executor:
+            # chunksize amortizes IPC across batches of small files, ~4 batches per worker
+            results = executor.map(_compile_one, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+        else:
+            results = map(_compile_one, jobs)
+        for (_, cfile, *_), (rel, err) in zip(jobs, results):
+            total += 1
+            if err is None:
                 if not quiet:
-                    print(f"Compiled {rel} -> {cfile.relative_to(base)}")
-            except (py_compile.PyCompileError, OSError) as e:
+                    out_buf.append(f"Compiled {rel} -> {cfile.removeprefix(base_prefix)}")
+                    if len(out_buf) >= _OUTPUT_BATCH:
+                        sys.stdout.write("\n".join(out_buf) + "\n")
+                        out_buf.clear()
+            else:
                 errors += 1
-                print(f"FAILED {rel}: {e}", file=sys.stderr)
+                # Emit pending successes first so the error lands in order on a shared terminal
+                if out_buf:
+                    sys.stdout.write("\n".join(out_buf) + "\n")
+                    out_buf.clear()
+                sys.stdout.flush()
+                sys.stderr.write(f"FAILED {rel}: {err}\n")
+    if out_buf:
+        sys.stdout.write("\n".join(out_buf) + "\n")
     dur = time.time() - start
     if errors:
         print(f"Completed with {errors} errors out of {total} attempted in {dur:.2f}s", file=sys.stderr)
@@ -142,8 +248,11 @@ def main() -> int:
         print(f"Output: {out_root}")
         print(f"Roots:  {', '.join(args.roots)}")
         print(f"Opt:    {args.opt}")
+        print(f"Mode:   {args.invalidation}")
+        print(f"Jobs:   {args.workers or os.cpu_count()}")
 
-    return 1 if compile_tree(base, args.roots, out_root, args.opt, args.quiet) else 0
+    mode = _INVALIDATION_MODES[args.invalidation]
+    return 1 if compile_tree(base, args.roots, out_root, args.opt, args.quiet, mode, args.force, args.workers) else 0
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -2,9 +2,22 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
-from libsrc.rtiUtil.exceptions import BaseException
+# Single definition of the exception root lives in libsrc.rtiUtil.exceptions; re-exported here so
+# HLA-facing code has one import path and isinstance checks share the same class object.
+import warnings
+from libsrc.rtiUtil.exceptions import HLAException
 
-class FederateNotExecutionMember(BaseException):
+__all__ = ["HLAException", "FederateNotExecutionMember", "RTIinternalError"]
+
+class FederateNotExecutionMember(HLAException):
+    pass
+class RTIinternalError(HLAException):
     pass
-class RTIinternalError(BaseException):
-    pass
\ No newline at end of file
+
+def __getattr__(name):
+    # Deprecated alias kept out of the namespace and __all__ so it never shadows the builtin; use HLAException
+    if name == "BaseException":
+        warnings.warn("HLA1516_2025.RTI.exceptions.BaseException is deprecated; use HLAException",
+                      DeprecationWarning, stacklevel=2)
+        return HLAException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
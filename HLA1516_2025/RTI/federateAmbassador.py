@@ -18,8 +18,9 @@ class FederateAmbassador:
         Methods are named and numbered according to the HLA 1516-2010 standard sections.
     """
 
-    def __init__(self, data : FederateData = FederateData()):
-        self.my_data : FederateData = data
+    def __init__(self, data : FederateData | None = None):
+        # None sentinel: a FederateData() default would be built once at import and shared by every ambassador
+        self.my_data : FederateData = data if data is not None else FederateData()
 
     def connectionLost(self, fault_description: str) -> None:
         """
@@ -177,3 +178,17 @@ class FederateAmbassador:
             Raises:
                 FederateInternalError
         """
+
+
+def is_callback_overridden(ambassador: FederateAmbassador, callback_name: str) -> bool:
+    """
+        Description:
+            Report whether an ambassador's class replaces the default no-op for a callback,
+            letting dispatchers skip decoding callbacks that would only reach the base class.
+        Args:
+            ambassador (FederateAmbassador): Ambassador instance receiving callbacks.
+            callback_name (str): HLA callback method name (e.g. "reflectAttributeValues").
+        Returns:
+            bool: True if the ambassador's class defines its own implementation.
+    """
+    return getattr(type(ambassador), callback_name) is not getattr(FederateAmbassador, callback_name)
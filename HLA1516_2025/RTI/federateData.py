@@ -1,8 +1,34 @@
+from collections import defaultdict
+from typing import Any, Callable
 from HLA1516_2025.RTI.handles import (AttributeHandle, FederateHandle, InteractionClassHandle,
                                     ObjectClassHandle, ObjectInstanceHandle, ParameterHandle)
 
 
 class FederateData():
+    # Fixed attribute set: no per-instance __dict__, offset-based attribute access on every callback
+    __slots__ = (
+        "my_fed_pro_addr",
+        "my_fed_pro_port",
+        "my_connection_lost",
+        "my_federate_resigned",
+        "my_report_federation_executions_received",
+        "my_report_federation_execution_members_received",
+        "my_report_federation_execution_not_exist",
+        "name_reservation_returned",
+        "my_name_reservation_succeeded",
+        "my_federate_executions",
+        "my_attr_name_handles",
+        "my_attr_handle_names",
+        "my_attr_dispatch",
+        "my_object_instance_name_handles",
+        "my_object_instance_handle_names",
+        "my_object_instance_attrs",
+        "my_object_instance_classes",
+        "my_object_instance_names",
+        "my_interaction_parameter_values",
+        "my_removed_instances",
+    )
+
     def __init__(self):
         """
             Initialize federate data container with default network / state tracking values.
@@ -10,26 +36,27 @@ class FederateData():
             Args:
                 None
             Side Effects:
-                Populates instance attributes with default values (addresses, flags, caches, maps).
+                Creates the container attributes once, then delegates scalar defaults to clear().
             Notes:
                 Holds runtime state shared with the ambassador; lists / dicts allow external inspection by tests.
         """
-        self.my_fed_pro_addr : str = "127.0.0.1"
-        self.my_fed_pro_port : int = 15164
-        self.my_connection_lost : bool = False
-        self.my_federate_resigned : bool = False
-        self.my_report_federation_executions_received : bool = False
-        self.my_report_federation_execution_members_received : bool = False
-        self.name_reservation_returned : bool = False
-        self.my_name_reservation_succeeded : bool = False
         self.my_federate_executions : list[FederateHandle] = []
         self.my_attr_name_handles : dict[ObjectClassHandle, dict[str, AttributeHandle]] = {} #may need to change type
         self.my_attr_handle_names : dict[ObjectClassHandle, dict[AttributeHandle, str]] = {} #may need to change type
-        self.my_object_instance_name_handles : dict[FederateHandle, dict[str, tuple[ObjectInstanceHandle, ObjectClassHandle]]] = {}
-        self.my_object_instance_handle_names : dict[FederateHandle, dict[ObjectInstanceHandle, str]] = {}
-        self.my_object_instance_attrs : dict[ObjectInstanceHandle, dict[AttributeHandle, bytes]] = {}
+        # Per-class reflection decode tables built by the federate ambassador: attribute handle -> (field slot, decoder)
+        self.my_attr_dispatch : dict[ObjectClassHandle, dict[AttributeHandle, tuple[int, Callable[[bytes], Any]]]] = {}
+        # Per-federate maps are created on first discovery from that federate, with no setdefault at the call site
+        self.my_object_instance_name_handles : defaultdict[FederateHandle, dict[str, tuple[ObjectInstanceHandle, ObjectClassHandle]]] = defaultdict(dict)
+        self.my_object_instance_handle_names : defaultdict[FederateHandle, dict[ObjectInstanceHandle, str]] = defaultdict(dict)
+        # Per-instance attribute maps are created on the first reflection, likewise without a setdefault
+        self.my_object_instance_attrs : defaultdict[ObjectInstanceHandle, dict[AttributeHandle, bytes]] = defaultdict(dict)
         self.my_object_instance_classes : dict[ObjectInstanceHandle, ObjectClassHandle] = {}
-        self.my_interaction_parameter_values : dict[FederateHandle, dict[InteractionClassHandle, dict[ParameterHandle, bytes]]] = {}
+        # Flat instance -> name map so per-reflection lookups need no producing-federate level
+        self.my_object_instance_names : dict[ObjectInstanceHandle, str] = {}
+        # Flat map keyed on the handle triple: one hash probe per lookup, no nested setdefault
+        self.my_interaction_parameter_values : dict[tuple[FederateHandle, InteractionClassHandle, ParameterHandle], bytes] = {}
+        self.my_removed_instances : set[ObjectInstanceHandle] = set()
+        self.clear()
 
 
     def clear(self):
@@ -39,21 +66,27 @@ class FederateData():
             Args:
                 None
             Side Effects:
-                Restores container attributes to default values; empties mutable maps/lists.
+                Restores scalar attributes (address, port, status flags) to default values; empties every mutable map/list/set.
             Notes:
-                Recreates some flags (e.g., report_federation_execution_not_exist) to ensure consistency.
+                Containers are emptied in place rather than reallocated so their storage is reused across federation cycles.
         """
-        self.my_fed_pro_addr : str = "127.0.0.1"
-        self.my_fed_pro_port : int = 15164
-        self.my_connection_lost : bool = False
-        self.my_federate_resigned : bool = False
-        self.name_reservation_returned : bool = False
-        self.my_name_reservation_succeeded : bool = False
-        self.my_report_federation_execution_not_exist : bool = False
-        self.my_report_federation_executions_received : bool = False
-        self.my_report_federation_execution_members_received : bool = False
+        self.my_fed_pro_addr = "127.0.0.1"
+        self.my_fed_pro_port = 15164
+        self.my_connection_lost = False
+        self.my_federate_resigned = False
+        self.my_report_federation_executions_received = False
+        self.my_report_federation_execution_members_received = False
+        self.my_report_federation_execution_not_exist = False
+        self.name_reservation_returned = False
+        self.my_name_reservation_succeeded = False
+        self.my_federate_executions.clear()
+        self.my_attr_name_handles.clear()
+        self.my_attr_handle_names.clear()
+        self.my_attr_dispatch.clear()
         self.my_object_instance_name_handles.clear()
         self.my_object_instance_handle_names.clear()
         self.my_object_instance_attrs.clear()
         self.my_object_instance_classes.clear()
-        self.my_interaction_parameter_values.clear()
\ No newline at end of file
+        self.my_object_instance_names.clear()
+        self.my_interaction_parameter_values.clear()
+        self.my_removed_instances.clear()
\ No newline at end of file
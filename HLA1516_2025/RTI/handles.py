@@ -6,84 +6,118 @@ from __future__ import annotations
 
 # Handle type definitions for HLA FedPro protocol.
 
+_EMPTY = b""
+# Payloads at or below this size are interned; larger ones are always freshly allocated
+_INTERN_MAX_LEN = 16
+
 class HandleType(bytes):
     """Base class for all HLA handle types - direct cast from bytes"""
-    def __new__(cls, data: bytes = b""):
-        # Use __new__ since bytes is immutable
-        return super().__new__(cls, data)
+    __slots__ = ()
+    # Per-class intern table (plain dict: bytes subclasses cannot be weakly referenced, so entries are never
+    # released). Only classes with a fixed set of handles per federation (classes, attributes, parameters, ...)
+    # intern; handle types minted per object or per message set _INTERN = False so churn cannot grow the table.
+    _INTERN : bool = True
+    _interned : dict[bytes, HandleType] = {}
+    # Per-class memo of the str() text of interned handles (same classes and size limit as _interned);
+    # handles are logged on every callback
+    _text : dict[bytes, str] = {}
+    # Shared empty ("null") handle of each class; safe to share since handles are immutable bytes
+    NULL : HandleType
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+        cls._text = {}
+        cls.NULL = cls()
+
+    def __new__(cls, data: bytes = _EMPTY):
+        # Use __new__ since bytes is immutable; call bytes.__new__ directly to skip the super() lookup.
+        # Equal small handles share one instance, so repeated decodes of the same handle do not allocate.
+        if cls._INTERN and isinstance(data, bytes) and len(data) <= _INTERN_MAX_LEN:
+            interned = cls._interned
+            handle = interned.get(data)
+            if handle is None:
+                handle = interned[data] = bytes.__new__(cls, data)
+            return handle
+        return bytes.__new__(cls, data)
     
     def __str__(self):
-        return f"{self.__class__.__name__}({self.hex()})"
+        text = self._text.get(self)
+        if text is None:
+            text = f"{self.__class__.__name__}({self.hex()})"
+            # Only interning classes memoize, and only small payloads, so the memo grows exactly like the
+            # intern table; per-instance handles are formatted each time and hold no memory after removal
+            if self._INTERN and len(self) <= _INTERN_MAX_LEN:
+                self._text[self] = text
+        return text
     
-    def __repr__(self):
-        return self.__str__()
+    # Same text as str(); aliased rather than wrapped to avoid an extra call frame
+    __repr__ = __str__
     
     def __bool__(self):
         return len(self) > 0
     
     @property
     def data(self) -> bytes:
-        """Provide .data attribute for compatibility with protobuf wrappers."""
-        return bytes(self)
+        """Provide .data attribute for compatibility with protobuf wrappers.
+        Returns the handle itself (already an immutable bytes subclass) rather than a copy."""
+        return self
+
+HandleType.NULL = HandleType()
 
 class FederateHandle(HandleType):
     """Federate handle type - cast from bytes"""
+    __slots__ = ()
 
 class ObjectClassHandle(HandleType):
     """Object class handle type - cast from bytes"""
+    __slots__ = ()
 
 class AttributeHandle(HandleType):
     """Attribute handle type - cast from bytes"""
+    __slots__ = ()
 
 class InteractionClassHandle(HandleType):
     """Interaction class handle type - cast from bytes"""
+    __slots__ = ()
 
 class ParameterHandle(HandleType):
     """Parameter handle type - cast from bytes"""
+    __slots__ = ()
 
 class ObjectInstanceHandle(HandleType):
     """Object instance handle type - cast from bytes"""
+    __slots__ = ()
+    # One per registered/discovered instance: interning would keep every removed instance alive
+    _INTERN = False
 
 class MessageRetractionHandle(HandleType):
     """Message retraction handle type - cast from bytes"""
+    __slots__ = ()
+    # One per timestamped message sent: never interned for the same reason
+    _INTERN = False
 
 class TransportationTypeHandle(HandleType):
     """Transportation type handle type - cast from bytes"""
+    __slots__ = ()
 
 class DimensionHandle(HandleType):
     """Dimension handle type - cast from bytes"""
+    __slots__ = ()
 
 class RegionHandle(HandleType):
     """Region handle type - cast from bytes"""
-
-# Convenience constructors
-
-def federate_handle(data: bytes) -> FederateHandle:
-    return FederateHandle(data)
-
-def object_class_handle(data: bytes) -> ObjectClassHandle:
-    return ObjectClassHandle(data)
-
-def attribute_handle(data: bytes) -> AttributeHandle:
-    return AttributeHandle(data)
-
-def interaction_class_handle(data: bytes) -> InteractionClassHandle:
-    return InteractionClassHandle(data)
-
-def parameter_handle(data: bytes) -> ParameterHandle:
-    return ParameterHandle(data)
-
-def object_instance_handle(data: bytes) -> ObjectInstanceHandle:
-    return ObjectInstanceHandle(data)
-
-def message_retraction_handle(data: bytes) -> MessageRetractionHandle:
-    return MessageRetractionHandle(data)
-
-def transportation_type_handle(data: bytes) -> TransportationTypeHandle:
-    return TransportationTypeHandle(data)
-
-def dimension_handle(data: bytes) -> DimensionHandle:
-    return DimensionHandle(data)
-
-def region_handle(data: bytes) -> RegionHandle:
-    return RegionHandle(data)
+    __slots__ = ()
+
+# Convenience constructors (aliases of the classes themselves, so no extra call frame)
+
+federate_handle = FederateHandle
+object_class_handle = ObjectClassHandle
+attribute_handle = AttributeHandle
+interaction_class_handle = InteractionClassHandle
+parameter_handle = ParameterHandle
+object_instance_handle = ObjectInstanceHandle
+message_retraction_handle = MessageRetractionHandle
+transportation_type_handle = TransportationTypeHandle
+dimension_handle = DimensionHandle
+region_handle = RegionHandle
@@ -3,13 +3,22 @@
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
 from __future__ import annotations
-from HLA1516_2025.RTI.enums import Enums
-from HLA1516_2025.RTI.rtiConfiguration import RtiConfiguration
-from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador
-from HLA1516_2025.RTI.typedefs import (AttributeHandleSet, AttributeHandleValueMap, FederationExecutionInformationVector,
-                                    ParameterHandleValueMap, ConfigurationResult)
+from typing import TYPE_CHECKING
+from HLA1516_2025.RTI.typedefs import ConfigurationResult
 from HLA1516_2025.RTI.handles import AttributeHandle, FederateHandle, ObjectClassHandle, ObjectInstanceHandle, InteractionClassHandle, ParameterHandle
 
+# Annotation-only imports: the stubs never touch these at runtime
+if TYPE_CHECKING:
+    from HLA1516_2025.RTI.enums import Enums
+    from HLA1516_2025.RTI.rtiConfiguration import RtiConfiguration
+    from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador
+    from HLA1516_2025.RTI.typedefs import (AttributeHandleSet, AttributeHandleValueMap, AttributeValueBatch, FederationExecutionInformationVector,
+                                        ParameterHandleValueMap, UserSuppliedTag)
+
+# Shared immutable result returned by the stub connect (no per-call allocation).
+# Stub handle getters return each handle class's shared NULL handle likewise.
+_DEFAULT_CONFIG_RESULT = ConfigurationResult()
+
 class RtiAmbassador:
     """Concrete no-op stub methods for RTI ambassador surface."""
     def connect(self, federateAmbassador: FederateAmbassador, configuration: RtiConfiguration) -> ConfigurationResult:
@@ -27,9 +36,9 @@ class RtiAmbassador:
                 federateAmbassador: Federate ambassador callback implementation instance.
                 configuration (RtiConfiguration): RTI configuration object (fom modules, settings, etc.).
             Returns:
-                None. Stub implementation performs no action.
+                ConfigurationResult: Shared default result. Stub implementation performs no action.
         """
-        return ConfigurationResult()
+        return _DEFAULT_CONFIG_RESULT
 
     def create_fed_ex(self, federation_name: str, fom_modules: FederationExecutionInformationVector) -> None:
         """
@@ -78,7 +87,7 @@ class RtiAmbassador:
             Returns:
                 FederateHandle: New federate handle (stub returns default constructed handle).
         """
-        return FederateHandle()
+        return FederateHandle.NULL
 
     def destroy_federation_execution(self, federation_name: str) -> bool:
         """
@@ -111,7 +120,7 @@ class RtiAmbassador:
         """
         return False
 
-    def resign_federation_execution(self, resign_action: Enums.ResignAction = Enums.ResignAction.NO_ACTION) -> bool:
+    def resign_federation_execution(self, resign_action: Enums.ResignAction | None = None) -> bool:
         """
             Clause:
                 4.12
@@ -124,7 +133,7 @@ class RtiAmbassador:
                 CallNotAllowedFromWithinCallback
                 RTIinternalError
             Args:
-                resign_action (str): Resignation action policy (default "NO_ACTION").
+                resign_action (Enums.ResignAction | None): Resignation action policy (None means NO_ACTION).
             Returns:
                 bool: False (stub implementation; no resign semantics executed).
         """
@@ -144,7 +153,7 @@ class RtiAmbassador:
             Returns:
                 ObjectClassHandle: Default constructed handle (stub).
         """
-        return ObjectClassHandle()
+        return ObjectClassHandle.NULL
 
     def get_attribute_handle(self, class_handle: ObjectClassHandle, attr_name: str) -> AttributeHandle:
         """
@@ -162,7 +171,7 @@ class RtiAmbassador:
             Returns:
                 AttributeHandle: Default constructed handle (stub).
         """
-        return AttributeHandle()
+        return AttributeHandle.NULL
 
     def get_interaction_class_handle(self, interaction_name: str) -> InteractionClassHandle:
         """
@@ -178,7 +187,7 @@ class RtiAmbassador:
             Returns:
                 InteractionClassHandle: Default constructed handle (stub).
         """
-        return InteractionClassHandle()
+        return InteractionClassHandle.NULL
 
     def get_parameter_handle(self, interaction_handle: InteractionClassHandle, param_name: str) -> ParameterHandle:
         """
@@ -196,7 +205,7 @@ class RtiAmbassador:
             Returns:
                 ParameterHandle: Default constructed handle (stub).
         """
-        return ParameterHandle()
+        return ParameterHandle.NULL
 
     def publish_object_class_attributes(self, class_handle: ObjectClassHandle, attr_set: AttributeHandleSet) -> None:
         """
@@ -376,9 +385,9 @@ class RtiAmbassador:
             Returns:
                 ObjectInstanceHandle: Default constructed handle (stub).
         """
-        return ObjectInstanceHandle()
+        return ObjectInstanceHandle.NULL
 
-    def delete_object_instance(self, object_instance_handle: ObjectInstanceHandle, user_supplied_tag: bytes = b"") -> bool:
+    def delete_object_instance(self, object_instance_handle: ObjectInstanceHandle, user_supplied_tag: UserSuppliedTag = b"") -> bool:
         """
             Clause:
                 6.16
@@ -392,13 +401,13 @@ class RtiAmbassador:
                 RTIinternalError
             Args:
                 object_instance_handle (ObjectInstanceHandle): Handle identifying object instance to delete.
-                user_supplied_tag (bytes): Optional user tag (default empty bytes).
+                user_supplied_tag (UserSuppliedTag): Optional bytes-like user tag (default empty bytes).
             Returns:
                 bool: False (stub; no deletion performed).
         """
         return False
 
-    def send_interaction(self, interaction_class_handle: InteractionClassHandle, parameter_values: ParameterHandleValueMap, user_supplied_tag: bytes = b"") -> None:
+    def send_interaction(self, interaction_class_handle: InteractionClassHandle, parameter_values: ParameterHandleValueMap, user_supplied_tag: UserSuppliedTag = b"") -> None:
         """
             Clause:
                 6.12
@@ -414,12 +423,12 @@ class RtiAmbassador:
             Args:
                 interaction_class_handle (InteractionClassHandle): Interaction class being sent.
                 parameter_values (dict[ParameterHandle, bytes]): Mapping of parameter handles to encoded data.
-                user_supplied_tag (bytes): Optional user tag (default empty bytes).
+                user_supplied_tag (UserSuppliedTag): Optional bytes-like user tag (default empty bytes).
             Returns:
                 bool: False (stub; no interaction transmission performed).
         """
 
-    def update_attribute_values(self, object_instance_handle: ObjectInstanceHandle, attribute_values: AttributeHandleValueMap, user_supplied_tag: bytes=b"")-> None:
+    def update_attribute_values(self, object_instance_handle: ObjectInstanceHandle, attribute_values: AttributeHandleValueMap | AttributeValueBatch, user_supplied_tag: UserSuppliedTag=b"")-> None:
         """
             Clause:
                 6.7 (Update Attribute Values)  # (Approximate clause; adjust if different in spec)
@@ -427,8 +436,8 @@ class RtiAmbassador:
                 Update a set of attributes for a given object instance; sends update attribute values request.
             Args:
                 object_instance_handle (ObjectInstanceHandle): Target instance handle.
-                attribute_values (dict[AttributeHandle, bytes]): Attribute handle to new raw value mapping.
-                user_supplied_tag (bytes): Optional tag to attach; may be empty.
+                attribute_values (dict[AttributeHandle, bytes] | AttributeValueBatch): Attribute handle to new raw value mapping.
+                user_supplied_tag (UserSuppliedTag): Optional bytes-like tag to attach; may be empty.
             Returns:
                 None.
             Throws:
@@ -2,9 +2,18 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
+from __future__ import annotations
+import copy
+import sys
+
 class RtiConfiguration:
+    __slots__ = ("configuration_name", "host", "port", "additional_settings")
+    configuration_name : str
+    host : str
+    port : int
+    additional_settings : str
 
-    def __init__(self):
+    def __init__(self) -> None:
         """
             Description: Initialize configuration with default loopback RTI address and empty metadata.
             Inputs: None
@@ -12,78 +21,75 @@ class RtiConfiguration:
             Exceptions: None
         """
         self.configuration_name = ""
-        self.rti_address = list()
-        self.rti_address.append("127.0.0.1")
-        self.rti_address.append(5000)  # Assuming rtiAddress is a tuple of (ipAddress, port)
+        self.host, self.port = "127.0.0.1", 5000
         self.additional_settings = ""
 
-    def createConfiguration(self):
+    def createConfiguration(self) -> RtiConfiguration:
         """
             Description: Factory helper returning a fresh default configuration.
             Inputs: None
             Outputs: RtiConfiguration new instance.
             Exceptions: None
         """
-        creation = RtiConfiguration()
-        return creation
+        return RtiConfiguration()
 
-    def withConfigurationName(self, configurationName):
+    def withConfigurationName(self, configurationName: str) -> RtiConfiguration:
         """
             Description: Build new configuration with specified name (immutable pattern).
             Inputs:
                 configurationName (str): Desired configuration name.
-            Outputs: RtiConfiguration new instance with name set.
+            Outputs: RtiConfiguration shallow copy of self with name set.
             Exceptions: None
         """
-        creation = RtiConfiguration()
-        creation.configuration_name = configurationName
+        creation = copy.copy(self)
+        creation.configuration_name = sys.intern(configurationName)
         return creation
 
-    def withRtiAddress(self, rtiAddress):
+    def withRtiAddress(self, rtiAddress: tuple[str, int] | list) -> RtiConfiguration:
         """
             Description: Build new configuration using provided RTI address [ip, port].
             Inputs:
                 rtiAddress (list|tuple): Address container; element 0 ip string, 1 port int.
-            Outputs: RtiConfiguration new instance with address set.
+            Outputs: RtiConfiguration shallow copy of self with address set.
             Exceptions: None (no validation performed).
         """
-        creation = RtiConfiguration()
-        creation.rti_address = rtiAddress
+        creation = copy.copy(self)
+        creation.host, creation.port = rtiAddress[0], rtiAddress[1]
         return creation
 
-    def withAdditionalSettings(self, additionalSettings):
+    def withAdditionalSettings(self, additionalSettings: str) -> RtiConfiguration:
         """
             Description: Build new configuration with additional settings string.
             Inputs:
                 additionalSettings (str): Free-form settings text.
-            Outputs: RtiConfiguration new instance with additional_settings set.
+            Outputs: RtiConfiguration shallow copy of self with additional_settings set.
             Exceptions: None
         """
-        creation = RtiConfiguration()
-        creation.additional_settings = additionalSettings
+        creation = copy.copy(self)
+        creation.additional_settings = sys.intern(additionalSettings)
         return creation
     
-    def setAddr(self, addr):
+    def setAddr(self, addr: str) -> None:
         """
             Description: Mutate IP address of existing configuration.
             Inputs:
                 addr (str): New IP address.
             Outputs: None
-            Exceptions: IndexError if rti_address malformed.
+            Exceptions: None
         """
-        self.rti_address[0] = addr
+        self.host = addr
     
-    def setPort(self, port):
+    def setPort(self, port: int) -> None:
         """
             Description: Mutate port of existing configuration.
             Inputs:
                 port (int): New port number.
             Outputs: None
-            Exceptions: IndexError if rti_address malformed.
+            Exceptions: None
         """
-        self.rti_address[1] = port
+        self.port = port
 
-    def configurationName(self):
+    def configurationName(self) -> str:
         """
             Description: Accessor for configuration name.
             Inputs: None
@@ -92,16 +98,26 @@ class RtiConfiguration:
         """
         return self.configuration_name
 
-    def rtiAddress(self):
+    @property
+    def rti_address(self) -> tuple[str, int]:
+        """
+            Description: Compatibility view of the RTI address as (ip, port); prefer host / port directly.
+            Inputs: None
+            Outputs: tuple containing IP and port.
+            Exceptions: None
+        """
+        return (self.host, self.port)
+
+    def rtiAddress(self) -> tuple[str, int]:
         """
-            Description: Accessor for RTI address list [ip, port].
+            Description: Accessor for RTI address (ip, port).
             Inputs: None
-            Outputs: list containing IP and port.
+            Outputs: tuple containing IP and port.
             Exceptions: None
         """
-        return self.rti_address
+        return (self.host, self.port)
 
-    def additionalSettings(self):
+    def additionalSettings(self) -> str:
         """
             Description: Accessor for additional settings string.
             Inputs: None
@@ -2,28 +2,51 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
+from dataclasses import dataclass
 from HLA1516_2025.RTI.enums import Enums
 from HLA1516_2025.RTI.handles import AttributeHandle, ParameterHandle
 
 FederationExecutionInformation = tuple[str, str]
 FederationExecutionInformationVector = list[FederationExecutionInformation]
 
-AttributeHandleSet = set[AttributeHandle]
+# Immutable so a set can be compared against (and stored as) the last one published
+AttributeHandleSet = frozenset[AttributeHandle]
+
+def make_attr_set(handles) -> AttributeHandleSet:
+    return frozenset(handles)
 
 AttributeHandleValueMap = dict[AttributeHandle, bytes]
 ParameterHandleValueMap = dict[ParameterHandle, bytes]
 
-class ConfigurationResult():
+# Any bytes-like tag; an empty tag is left off the request entirely
+UserSuppliedTag = bytes | bytearray | memoryview
+
+# Parallel-sequence alternative to AttributeHandleValueMap for values that are built once and sent repeatedly
+@dataclass(slots=True)
+class AttributeValueBatch:
+    handles : tuple[AttributeHandle, ...] = ()
+    values : tuple[bytes, ...] = ()
+
+    @classmethod
+    def from_dict(cls, attribute_values: AttributeHandleValueMap) -> "AttributeValueBatch":
+        if not attribute_values:
+            return cls()
+        handles, values = zip(*attribute_values.items())
+        return cls(handles, values)
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def items(self):
+        # Mirrors dict.items() so a batch can be passed wherever an AttributeHandleValueMap is read
+        return zip(self.handles, self.values)
+
+_SETTINGS_IGNORED = Enums.AdditionalSettingsResultCode.SETTINGS_IGNORED
+
+# Frozen: instances may be shared (see RtiAmbassador.connect); use dataclasses.replace() to derive a modified copy
+@dataclass(slots=True, frozen=True)
+class ConfigurationResult:
     configuration_used : bool = False
     address_used : bool = False
-    additional_settings_result : Enums.AdditionalSettingsResultCode = Enums.AdditionalSettingsResultCode.SETTINGS_IGNORED
-    message : str = ""
-
-    def __init__(self, config_used: bool = False,
-                addr_used: bool = False,
-                add_settings: Enums.AdditionalSettingsResultCode = Enums.AdditionalSettingsResultCode.SETTINGS_IGNORED,
-                message: str = ""):
-        self.configuration_used = config_used
-        self.address_used = addr_used
-        self.additional_settings_result = add_settings
-        self.message = message
\ No newline at end of file
+    additional_settings_result : Enums.AdditionalSettingsResultCode = _SETTINGS_IGNORED
+    message : str = ""
\ No newline at end of file
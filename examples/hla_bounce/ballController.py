@@ -4,9 +4,11 @@
 """
 import os
 import time
-import math
+import atexit
+import json
 import struct
-from typing import Dict
+import hashlib
+from typing import Callable
 from libsrc.rtiUtil.logger import *
 from libsrc.rtiUtil import exceptions as Exceptions
 from HLA1516_2025.RTI import rtiConfiguration, exceptions, federateData
@@ -17,6 +19,35 @@ from libsrc.fedPro.callResponseMessage import CallResponseMessage
 from libsrc.fedProWrapper.rtiAmbassadorFedPro import RtiAmbassadorFedPro
 from examples.hla_bounce.hlaBounceFederateAmbassador import HlaBounceFederateAmbassador
 from HLA1516_2025.RTI.handles import AttributeHandle, ObjectClassHandle, ObjectInstanceHandle
+from HLA1516_2025.RTI.typedefs import AttributeHandleSet, make_attr_set
+
+# Precompiled big-endian packers for the Ball attribute encodings (byte, short, double)
+_PACK_BYTE = struct.Struct('>B').pack
+_PACK_SHORT = struct.Struct('>h').pack
+_PACK_DOUBLE = struct.Struct('>d').pack
+
+class _PackedValueMemo(dict):
+    """Value -> encoded bytes memo; packs (and remembers) a value on its first lookup."""
+    __slots__ = ("pack",)
+
+    def __init__(self, pack: Callable[[int], bytes]):
+        super().__init__()
+        self.pack = pack
+
+    def __missing__(self, value: int) -> bytes:
+        packed = self[value] = self.pack(value)
+        return packed
+
+# Ball attributes are small integers from narrow ranges (color byte; size, on-screen location and speed
+# shorts), so sends reuse the same immutable bytes objects instead of allocating new ones per pack.
+# Growth is bounded by the byte/short value ranges
+_BYTE_VALUES = _PackedValueMemo(_PACK_BYTE)
+_SHORT_VALUES = _PackedValueMemo(_PACK_SHORT)
+
+_BALL_ATTRIBUTE_NAMES = ["Color", "Size", "XLocation", "YLocation", "Speed", "Direction"]
+
+# Resolved Ball handles are persisted here between runs, one file per FOM module set
+_HANDLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hla_bounce")
 
 class BallController():
     """HLA Bounce Ball Controller - manages ball objects via HLA."""
@@ -61,14 +92,32 @@ class BallController():
         self.x_location_handle : AttributeHandle
         self.color_handle : AttributeHandle
         self.size_handle : AttributeHandle
+        # All six Ball attributes, built once the handles resolve; shared by publish and subscribe
+        self.ball_attr_handles : AttributeHandleSet = make_attr_set(())
+        # Ball -> attribute map encoder specialized to the resolved handles and world size (see build_ball_encoder)
+        self.encode_ball : Callable[[Ball], dict[AttributeHandle, bytes]] | None = None
         
         # Simulation parameters
         self.world_width : int = 500
         self.world_height : int = 500
         self.ball_radius : float = 5.0
+        # Dead-reckoning thresholds: an owned ball is only re-sent when remote extrapolation from its
+        # last sent state is off by pos_threshold pixels, its velocity changed by vel_threshold,
+        # or max_update_interval seconds have passed (heartbeat)
+        self.pos_threshold : float = 1.0
+        self.vel_threshold : float = 0.1
+        self.max_update_interval : float = 1.0
+        # Per-ball send throttle in simulation ticks (0.1 s at the GUI's 60 Hz tick; run_tick rescales it
+        # to its target rate), counted by my_tick instead of comparing wall-clock timestamps
+        self.send_every_ticks : int = 6
+        self.my_tick : int = 0
         self.simulation_running = False
-        self.last_update_time = time.time()
+        # Simulation and send-throttle timestamps come from the monotonic perf_counter clock
+        self.last_update_time = time.perf_counter()
         self.list_refresh_needed = False
+        # True once cleanup() has torn down the current federation membership (or nothing was joined)
+        self.my_cleaned_up = True
+        self.my_atexit_registered = False
         # Map object instance handle bytes->ball_id
         self._inst_to_ball = {}
         self.my_object_instance_Name_Handles : dict[str, ObjectInstanceHandle] = {}
@@ -171,6 +220,12 @@ class BallController():
             if not self.join():
                 print("ERROR: Failed to join federation")
                 return False
+            # Joined: cleanup() now has work to do. The exit hook is a safety net for callers
+            # that never call cleanup(); cleanup() itself is idempotent
+            self.my_cleaned_up = False
+            if not self.my_atexit_registered:
+                atexit.register(self.cleanup)
+                self.my_atexit_registered = True
 
             # Get ball object class handles
             if not self.get_ball_handles():
@@ -184,20 +239,45 @@ class BallController():
             print(f"ERROR: HLA initialization failed: {e}")
             return False
 
-    def pump_hla(self):
+    def run_tick(self, target_hz: float = 20.0, pace: bool = True, simulate: bool = True) -> float:
         """
-            Invoke a short callback processing slice to keep RTI events flowing.
+            Run one fixed-rate federate tick: evoke callbacks within half the tick budget, apply the queued
+            reflections, advance the simulation (which sends the tick's batched attribute updates), then optionally sleep to the
+            next tick boundary.
 
-            Side Effects:
-                Processes queued callbacks via underlying ambassador.
+            Args:
+                target_hz (float): Tick rate; the tick period is 1 / target_hz seconds.
+                pace (bool): Sleep out the rest of the period (False when an event loop timer already paces calls).
+                simulate (bool): Advance ball physics this tick; callbacks are evoked either way.
+            Returns:
+                float: Simulation dt applied this tick, in seconds (0.0 when simulate is False).
             exceptions:
-                Suppresses any exceptions (non-fatal UI loop support).
+                Callback errors are suppressed (non-fatal for the driving loop); simulation errors propagate.
         """
+        period = 1.0 / target_hz
+        self.send_every_ticks = max(1, round(0.1 * target_hz))
+        tick_start = time.perf_counter()
         try:
-            # Evoke callbacks briefly; underlying code queues/dispatches
-            self.my_rti_ambassador.evoke_callback(0.05)
+            self.my_rti_ambassador.evoke_callback(period / 2)
         except Exception as e:
             pass
+        # Apply this tick's reflections in one pass before stepping the simulation
+        self.my_federate_ambassador.flush_reflects()
+
+        dt = 0.0
+        if simulate:
+            now = time.perf_counter()
+            dt = now - self.last_update_time
+            self.last_update_time = now
+            self.update_simulation(dt)
+        else:
+            self.last_update_time = time.perf_counter()
+
+        if pace:
+            remaining = tick_start + period - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        return dt
 
     def get_ball_handles(self) -> bool:
         """
@@ -209,36 +289,138 @@ class BallController():
                 Broad exceptions caught, prints error, returns False.
         """
         try:
-            # Get object class handle (assuming a Ball class exists in FOM)
-            self.ball_class_handle : ObjectClassHandle 
-            if self.my_rti_ambassador.my_obj_name_handles is {} or "Ball" not in self.my_rti_ambassador.my_obj_name_handles:
-                self.ball_class_handle = self.my_rti_ambassador.get_object_class_handle("Ball")
-                self.my_data.my_attr_name_handles[self.ball_class_handle] = {}
-            else:
-                self.ball_class_handle = self.my_rti_ambassador.my_obj_name_handles["Ball"]
-
-            if self.my_data.my_attr_name_handles[self.ball_class_handle] == {} or self.ball_class_handle not in self.my_data.my_attr_name_handles[self.ball_class_handle]:
-                # Get attribute handles using the correct names from the FOM
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["Color"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "Color")
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["Size"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "Size")
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["XLocation"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "XLocation")
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["YLocation"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "YLocation")
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["Speed"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "Speed")
-                self.my_data.my_attr_name_handles[self.ball_class_handle]["Direction"] = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, "Direction")
-
-            self.color_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["Color"]
-            self.size_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["Size"]
-            self.x_location_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["XLocation"]
-            self.y_location_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["YLocation"]
-            self.speed_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["Speed"]
-            self.direction_handle = self.my_data.my_attr_name_handles[self.ball_class_handle]["Direction"]
-
-            print("Successfully retrieved ball attribute handles")
+            # Get object class handle (assuming a Ball class exists in FOM); served from the ambassador cache when known
+            self.ball_class_handle : ObjectClassHandle = self.my_rti_ambassador.get_object_class_handle("Ball")
+
+            # A disk cache from a previous run is only trusted when its class handle matches the live one
+            # and a sample attribute resolved live (a real round trip: nothing is seeded yet) agrees with it,
+            # since handles are scoped to one federation execution
+            cache_path = self.handle_cache_path()
+            cached_attrs = self.load_cached_handles(cache_path)
+            if cached_attrs is not None:
+                probe_name = _BALL_ATTRIBUTE_NAMES[0]
+                live_handle = self.my_rti_ambassador.get_attribute_handle(self.ball_class_handle, probe_name)
+                if cached_attrs.get(probe_name) != live_handle:
+                    log_info(f"Handle cache {cache_path} is stale, resolving all Ball attribute handles")
+                    cached_attrs = None
+            if cached_attrs is not None:
+                for attr_name, attr_handle in cached_attrs.items():
+                    self.my_data.my_attr_name_handles.setdefault(self.ball_class_handle, {})[attr_name] = attr_handle
+                    self.my_data.my_attr_handle_names.setdefault(self.ball_class_handle, {})[attr_handle] = attr_name
+
+            # Get attribute handles using the correct names from the FOM (cached names cost no round trip)
+            handles = self.my_rti_ambassador.get_attribute_handles_batch(self.ball_class_handle, _BALL_ATTRIBUTE_NAMES)
+            if cached_attrs is None:
+                self.store_cached_handles(cache_path, handles)
+            self.color_handle = handles["Color"]
+            self.size_handle = handles["Size"]
+            self.x_location_handle = handles["XLocation"]
+            self.y_location_handle = handles["YLocation"]
+            self.speed_handle = handles["Speed"]
+            self.direction_handle = handles["Direction"]
+            self.ball_attr_handles = make_attr_set(handles.values())
+            self.encode_ball = self.build_ball_encoder()
+
+            log_debug("Successfully retrieved ball attribute handles")
             return True
             
         except Exception as e:
-            print(f"ERROR: Failed to get ball handles: {e}")
+            log_error(f"ERROR: Failed to get ball handles: {e}")
             return False
+
+    def build_ball_encoder(self) -> Callable[[Ball], dict[AttributeHandle, bytes]]:
+        """
+            Build the Ball attribute encoder with the resolved attribute handles and world center bound as
+            closure constants, so each send is one call building one dict display with no attribute lookups.
+
+            Returns:
+                Callable[[Ball], dict[AttributeHandle, bytes]]: Encoder returning a fresh map per call
+                (update_simulation queues several maps per batch).
+            exceptions:
+                Encoder raises struct.error for out-of-range values; update_ball_attributes handles it.
+        """
+        color_handle = self.color_handle
+        size_handle = self.size_handle
+        x_handle = self.x_location_handle
+        y_handle = self.y_location_handle
+        speed_handle = self.speed_handle
+        direction_handle = self.direction_handle
+        # Locations are sent relative to the world center
+        half_width = self.world_width // 2
+        half_height = self.world_height // 2
+        byte_values = _BYTE_VALUES
+        short_values = _SHORT_VALUES
+        pack_double = _PACK_DOUBLE
+
+        def encode_ball(ball: Ball) -> dict[AttributeHandle, bytes]:
+            # The direction attribute is measured in radians; speed and direction are derived from
+            # the ball's dx, dy values (cached on the ball across bounces)
+            speed, direction_radians = ball.speed_and_direction()
+            return {
+                color_handle: byte_values[ball.color],
+                size_handle: short_values[ball.scale],
+                x_handle: short_values[int(ball.x - half_width)],
+                y_handle: short_values[int(ball.y - half_height)],
+                speed_handle: short_values[int(speed)],
+                direction_handle: pack_double(direction_radians),
+            }
+        return encode_ball
+
+    def handle_cache_path(self) -> str:
+        """
+            Build the on-disk handle cache path for the configured FOM modules.
+
+            Returns:
+                str: Cache file path keyed by a hash of each FOM module path and modification time.
+        """
+        digest = hashlib.sha1()
+        for module in self.my_configuration.fom_modules:
+            try:
+                mtime = os.path.getmtime(module.replace("\\", os.sep))
+            except OSError:
+                mtime = 0.0
+            digest.update(f"{module}|{mtime}\n".encode())
+        return os.path.join(_HANDLE_CACHE_DIR, f"handles_{digest.hexdigest()[:16]}.json")
+
+    def load_cached_handles(self, cache_path: str) -> dict[str, AttributeHandle] | None:
+        """
+            Load Ball attribute handles persisted by a previous run.
+
+            Args:
+                cache_path (str): File produced by store_cached_handles.
+            Returns:
+                dict[str, AttributeHandle] | None: Cached name -> handle map, or None when the file is missing,
+                malformed, or was recorded against a different Ball class handle.
+        """
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if bytes.fromhex(cached["class"]) != bytes(self.ball_class_handle):
+                return None
+            return {str(name): AttributeHandle(bytes.fromhex(raw)) for name, raw in cached["attributes"].items()}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            log_warning(f"Ignoring unreadable handle cache {cache_path}: {e}")
+            return None
+
+    def store_cached_handles(self, cache_path: str, handles: dict[str, AttributeHandle]):
+        """
+            Persist resolved Ball attribute handles for later runs.
+
+            Args:
+                cache_path (str): Destination file.
+                handles (dict[str, AttributeHandle]): Attribute name -> handle map to record.
+            exceptions:
+                Filesystem errors are logged and ignored; the cache is only an optimization.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Plain hex strings: the file is data only, never executable on load
+            with open(cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"class": self.ball_class_handle.hex(), "attributes": {name: handle.hex() for name, handle in handles.items()}}, cache_file)
+        except OSError as e:
+            log_warning(f"Could not write handle cache {cache_path}: {e}")
             
     def publish_ball(self) -> bool:
         """
@@ -250,26 +432,16 @@ class BallController():
                 Catches generic exceptions; logs and returns False.
         """
         try:
-            # Create attribute handle set for publication
-            ball_attributes: Dict[str, AttributeHandle] = {
-                "Direction": self.direction_handle,
-                "Speed": self.speed_handle,
-                "YLocation": self.y_location_handle,
-                "XLocation": self.x_location_handle,
-                "Color": self.color_handle,
-                "Size": self.size_handle
-            }
-            
             # Publish ball object class
             if self.ball_class_handle is None:
                 raise RuntimeError("Ball class handle not resolved")
-            self.my_rti_ambassador.publish_object_class_attributes(self.ball_class_handle, set(ball_attributes.values()))
+            self.my_rti_ambassador.publish_object_class_attributes(self.ball_class_handle, self.ball_attr_handles)
                 
-            print("Successfully published ball attributes")
+            log_debug("Successfully published ball attributes")
             return True
             
         except Exception as e:
-            print(f"ERROR: Failed to setup ball publication: {e}")
+            log_error(f"ERROR: Failed to setup ball publication: {e}")
             return False
             
     def subscribe_ball(self) -> bool:
@@ -282,26 +454,16 @@ class BallController():
                 Catches generic exceptions; logs and returns False.
         """
         try:
-            # Create attribute handle set for subscription
-            ball_attributes: Dict[str, AttributeHandle] = {
-                "Direction": self.direction_handle,
-                "Speed": self.speed_handle,
-                "YLocation": self.y_location_handle,
-                "XLocation": self.x_location_handle,
-                "Color": self.color_handle,
-                "Size": self.size_handle
-            }
-            
             # Subscribe to ball object class
             if self.ball_class_handle is None:
                 raise RuntimeError("Ball class handle not resolved")
-            self.my_rti_ambassador.subscribe_object_class_attributes(self.ball_class_handle, set(ball_attributes.values()))
+            self.my_rti_ambassador.subscribe_object_class_attributes(self.ball_class_handle, self.ball_attr_handles)
             
-            print("Successfully subscribed to ball attributes")
+            log_debug("Successfully subscribed to ball attributes")
             return True
             
         except Exception as e:
-            print(f"ERROR: Failed to setup ball subscription: {e}")
+            log_error(f"ERROR: Failed to setup ball subscription: {e}")
             return False
             
     def create_local_ball(self, ball_id: str, x: int | None = None, y: int | None = None, dx: float = 4.0, dy: float = 4.0, scale: int = 10, color: int = 0) -> bool:
@@ -321,124 +483,217 @@ class BallController():
             exceptions:
                 Catches generic exceptions, logs, returns False.
         """
+        return self.create_local_balls_bulk([dict(ball_id=ball_id, x=x, y=y, dx=dx, dy=dy, scale=scale, color=color)])[0]
+
+    def create_local_balls_bulk(self, ball_specs: list[dict]) -> list[bool]:
+        """
+            Instantiate and publish several locally-owned Balls, grouping the RTI traffic by phase:
+            every name reservation, then the reservation callbacks, then every registration, then one
+            batched initial attribute update.
+
+            Args:
+                ball_specs (list[dict]): Keyword sets accepted by create_local_ball (ball_id required).
+            Returns:
+                list[bool]: Per-spec success flags, in input order.
+            exceptions:
+                Catches generic exceptions per phase, logs, and marks the affected balls as failed.
+        """
+        results = [False] * len(ball_specs)
         try:
-            # Set default position if not provided
-            if x is None:
-                x = int(self.world_width / 4)
-            if y is None:
-                y = int(self.world_height / 4)
-                
-            # Create ball object
-            temp_ball = Ball(ball_id, x, y, dx, dy, scale, color)
-            # Register object instance with RTI
-            self.my_rti_ambassador.reserve_object_instance_name(ball_id)
             if self.ball_class_handle is None:
                 raise RuntimeError("Ball class handle not resolved")
-            self.my_rti_ambassador.evoke_callback()
-            object_handle = self.my_rti_ambassador.register_object_instance(self.ball_class_handle, ball_id)
-            self.my_object_instance_Handle_Values[object_handle] = (self.ball_class_handle, {})
-                
-            if object_handle:
-                temp_ball.object_handle = object_handle
-                self.ball_data.add_ball(temp_ball, is_local=True)
-                
-                # Send initial attribute update
-                self.update_ball_attributes(temp_ball)
-                
-                print(f"Created local ball: {temp_ball}")
-                return True
-            else:
-                print(f"ERROR: Failed to register ball object instance: {ball_id}")
-                return False
-                
+            # Registering with a name needs the reservation callback, so reserve everything first and
+            # evoke the callbacks once per reservation instead of interleaving evoke with each register
+            for spec in ball_specs:
+                self.my_rti_ambassador.reserve_object_instance_name(spec["ball_id"])
+            for _ in ball_specs:
+                if not self.my_rti_ambassador.evoke_callback():
+                    break
         except Exception as e:
-            print(f"ERROR: Failed to create local ball {ball_id}: {e}")
-            return False
-            
-    def update_ball_attributes(self, ball: Ball):
+            log_error(f"ERROR: Failed to reserve local ball names: {e}")
+            return results
+
+        created : list[Ball] = []
+        for index, spec in enumerate(ball_specs):
+            ball_id = spec["ball_id"]
+            try:
+                # Set default position if not provided
+                x = spec.get("x")
+                y = spec.get("y")
+                if x is None:
+                    x = int(self.world_width / 4)
+                if y is None:
+                    y = int(self.world_height / 4)
+
+                # Create ball object and register it with the RTI
+                temp_ball = Ball(ball_id, x, y, spec.get("dx", 4.0), spec.get("dy", 4.0), spec.get("scale", 10), spec.get("color", 0))
+                object_handle = self.my_rti_ambassador.register_object_instance(self.ball_class_handle, ball_id)
+                self.my_object_instance_Handle_Values[object_handle] = (self.ball_class_handle, {})
+
+                if object_handle:
+                    temp_ball.object_handle = object_handle
+                    self.ball_data.add_ball(temp_ball, is_local=True)
+                    created.append(temp_ball)
+                    results[index] = True
+                    if debug_enabled():
+                        log_debug(f"Created local ball: {temp_ball}")
+                else:
+                    log_error(f"ERROR: Failed to register ball object instance: {ball_id}")
+            except Exception as e:
+                log_error(f"ERROR: Failed to create local ball {ball_id}: {e}")
+
+        # Send the initial attribute updates of all new balls as one batch
+        pending_balls : list[Ball] = []
+        updates = []
+        for ball in created:
+            attribute_values = self.update_ball_attributes(ball)
+            if attribute_values:
+                pending_balls.append(ball)
+                updates.append((ball.object_handle, attribute_values, b""))
+        if updates:
+            try:
+                sent_results = self.my_rti_ambassador.update_attribute_values_batch(updates)
+            except Exception as e:
+                log_error(f"ERROR: Failed to send initial ball attribute updates: {e}")
+                return results
+            now = time.perf_counter()
+            for ball, sent in zip(pending_balls, sent_results):
+                if sent:
+                    ball.mark_sent(now)
+        return results
+
+    def needs_attribute_update(self, ball: Ball, now: float) -> bool:
         """
-            Package Ball state into attribute value map and send update to RTI (with throttling).
+            Dead-reckoning gate: decide whether remote federates need a fresh update for an owned ball.
+
+            Args:
+                ball (Ball): Owned ball to check.
+                now (float): Current time in seconds.
+            Returns:
+                bool: True if the heartbeat interval expired, size/color changed, velocity changed beyond
+                vel_threshold, or the position drifted beyond pos_threshold from the linear extrapolation
+                of the last sent state.
+        """
+        elapsed = now - ball.last_attr_send_time
+        if elapsed >= self.max_update_interval:
+            return True
+        if ball.scale != ball.last_sent_scale or ball.color != ball.last_sent_color:
+            return True
+        vel_x = ball.dx - ball.last_sent_dx
+        vel_y = ball.dy - ball.last_sent_dy
+        if vel_x * vel_x + vel_y * vel_y >= self.vel_threshold * self.vel_threshold:
+            return True
+        err_x = ball.x - (ball.last_sent_x + ball.last_sent_dx * elapsed)
+        err_y = ball.y - (ball.last_sent_y + ball.last_sent_dy * elapsed)
+        return err_x * err_x + err_y * err_y >= self.pos_threshold * self.pos_threshold
+
+    def update_ball_attributes(self, ball: Ball) -> dict[AttributeHandle, bytes]:
+        """
+            Package Ball state into an attribute handle-value map ready to send to the RTI.
 
             Args:
                 ball (Ball): Ball whose state should be published.
-            Side Effects:
-                Updates ball.last_attr_send_time and sends attribute update via RTI ambassador.
+            Returns:
+                dict[AttributeHandle, bytes]: Encoded attribute values (empty if the ball could not be packed).
             exceptions:
                 Broad exceptions caught; logs error without raising.
         """
         try:
-            if not ball.ball_id != "":
-                return
-            # Throttle attribute updates to at most 10 Hz per ball
-            now = time.time()       
-            if (now - ball.last_attr_send_time) < 0.1:  # 100 ms minimum interval
-                return
-
-            # Create attribute handle-value map
-            attribute_values = {}
-            print(f"Updating attributes for ball {ball.ball_id}:\n pos=({ball.x},{ball.y})\n vel=({ball.dx},{ball.dy})\n color={ball.color}\n size={ball.scale}")
-            attribute_values[self.color_handle] = struct.pack('>B', ball.color)
-            attribute_values[self.size_handle] = struct.pack('>h', ball.scale)
-            attribute_values[self.x_location_handle] = struct.pack('>h', int(ball.x - 250))
-            attribute_values[self.y_location_handle] = struct.pack('>h', int(ball.y - 250))
-            # The direction attribute is measured in radians, perform some calculations to
-            # ball's x, y, dx, dy values to determine direction and speed
-            speed = math.sqrt(float(ball.dx) * float(ball.dx) + float(ball.dy) * float(ball.dy))
-            print(f"Calculated speed: {speed}")
-            attribute_values[self.speed_handle] = struct.pack('>h', int(speed))
-            direction_radians = math.atan2(float(ball.dy), float(ball.dx))
-            print(f"Calculated direction (radians): {direction_radians}")
-            attribute_values[self.direction_handle] = struct.pack('>d', direction_radians)
-            
-            # Update attributes
-            self.my_rti_ambassador.update_attribute_values(ball.object_handle, attribute_values, b"")
-            ball.last_attr_send_time = now
-
+            attribute_values = self.encode_ball(ball)  # type: ignore[misc]
+            if debug_enabled():
+                speed, direction_radians = ball.speed_and_direction()
+                log_debug(f"Updating attributes for ball {ball.ball_id}:\n pos=({ball.x},{ball.y})\n vel=({ball.dx},{ball.dy})\n color={ball.color}\n size={ball.scale}"
+                          f"\n speed={speed}\n direction (radians)={direction_radians}")
         except Exception as e:
-            print(f"ERROR: Failed to update ball attributes for {ball.ball_id}: {e}")
+            log_error(f"ERROR: Failed to update ball attributes for {ball.ball_id}: {e}")
+            return {}
+        return attribute_values
 
     def update_simulation(self, dt: float):
         """
-            Advance simulation by dt seconds: update positions, handle bounces, emit updates for owned balls.
+            Advance simulation by dt seconds: update positions, handle bounces, then send one batched update
+            covering every owned ball whose throttle window has expired and whose state has diverged from
+            what remote federates extrapolate (see needs_attribute_update).
 
             Args:
                 dt (float): Elapsed simulation timestep in seconds.
             exceptions:
                 None explicitly; relies on Ball methods assumed safe.
         """
-        for ball in self.ball_data.balls.values():
-            # Update position
-            ball.update_position(dt)
-            
-            # Check for bounces off walls
-            if ball.x <= self.ball_radius / 100 or ball.x >= (self.world_width - self.ball_radius):
-                ball.bounce_x()
-                ball.x = int(max(self.ball_radius / 100, min(float(self.world_width) - (self.ball_radius / 100), float(ball.x))))
-                
-            if ball.y <= self.ball_radius / 100 or ball.y >= (self.world_height - self.ball_radius):
-                ball.bounce_y()
-                ball.y = int(max(self.ball_radius / 100, min(float(self.world_height) - (self.ball_radius / 100), float(ball.y))))
-            # Send attribute update
-            if ball.is_owned:
-                print("Updating local ball")
-                self.update_ball_attributes(ball)
+        now = time.perf_counter()
+        self.my_tick = tick = self.my_tick + 1
+        send_every_ticks = self.send_every_ticks
+        pending_balls : list[Ball] = []
+        updates = []
+        # Wall limits are the same for every ball this tick; compute them once
+        min_pos = self.ball_radius / 100
+        bounce_x_at = self.world_width - self.ball_radius
+        bounce_y_at = self.world_height - self.ball_radius
+        clamp_x_max = float(self.world_width) - min_pos
+        clamp_y_max = float(self.world_height) - min_pos
+        floor_pos = int(min_pos)
+        # Owned balls are simulated and considered for sending; remote balls are only extrapolated (dead
+        # reckoning between reflections, which overwrite their state) and never reach the send checks
+        for balls, owned in ((self.ball_data.local_balls, True), (self.ball_data.remote_balls, False)):
+            for ball in balls.values():
+                # Update position (inlined Ball.update_position, sharing one timestamp per tick)
+                x = ball.x + ball.dx * dt
+                y = ball.y + ball.dy * dt
+                ball.last_update_time = now
+
+                # Check for bounces off walls: reflect the velocity and clamp against the wall that was hit.
+                # An overshoot on one side already rules out the other, so each clamp is a single min
+                if x <= min_pos:
+                    ball.dx = -ball.dx
+                    x = floor_pos
+                elif x >= bounce_x_at:
+                    ball.dx = -ball.dx
+                    x = int(min(clamp_x_max, x))
+
+                if y <= min_pos:
+                    ball.dy = -ball.dy
+                    y = floor_pos
+                elif y >= bounce_y_at:
+                    ball.dy = -ball.dy
+                    y = int(min(clamp_y_max, y))
+                ball.x = x
+                ball.y = y
+                if not owned:
+                    continue
+                # Queue attribute update, throttled to one send per send_every_ticks ticks per ball and gated by
+                # dead reckoning. The throttle window is tested first since it rejects most balls on most ticks
+                if tick - ball.last_send_tick >= send_every_ticks and ball.ball_id \
+                    and self.needs_attribute_update(ball, now):
+                    attribute_values = self.update_ball_attributes(ball)
+                    if attribute_values:
+                        pending_balls.append(ball)
+                        updates.append((ball.object_handle, attribute_values, b""))
+
+        if updates:
+            try:
+                results = self.my_rti_ambassador.update_attribute_values_batch(updates)
+            except Exception as e:
+                log_error(f"ERROR: Failed to send ball attribute updates: {e}")
+                return
+            for ball, sent in zip(pending_balls, results):
+                if sent:
+                    ball.mark_sent(now, tick)
 
     def cleanup(self):
         """
             Delete local object instances, resign, and attempt federation destruction.
 
             Side Effects:
-                Deletes objects, resigns, may destroy federation if possible.
+                Deletes objects, resigns, may destroy federation if possible. Does nothing if already cleaned up.
             exceptions:
                 Swallows most exceptions, logs warnings.
         """
+        if self.my_cleaned_up:
+            return
+        self.my_cleaned_up = True
         try:
-            # Delete all local object instances
-            for ball in self.ball_data.local_balls.values():
-                if ball.object_handle:
-                    self.my_rti_ambassador.delete_object_instance(ball.object_handle)  # type: ignore[arg-type]
-                        
-            # Resign from federation
+            # Resign from federation; DELETE_OBJECTS has the RTI delete every local object instance
+            # as part of this one call, so no per-ball delete_object_instance round trips are needed
             self.my_rti_ambassador.resign_federation_execution("DELETE_OBJECTS")
             
             # Destroy federation (may fail if other federates still joined)
@@ -476,9 +731,12 @@ class BallController():
             return True
         except Exception:
             return False
-            
-    def __del__(self):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         """
-            Ensure cleanup invoked during object finalization (ignores exceptionss).
+            Tear down RTI membership deterministically when leaving a with-block.
         """
         self.cleanup()
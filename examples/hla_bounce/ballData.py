@@ -2,8 +2,9 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
+import math
 import time
-from typing import Dict, Optional
+from typing import AbstractSet, Dict, Optional, Set
 from HLA1516_2025.RTI.handles import ObjectInstanceHandle
 
 class Ball:
@@ -30,26 +31,38 @@ class Ball:
         self.x : float = x
         self.y : float = y
         self.scale : int = scale  # size scale factor
-        self.dx : float = dx  # velocity in x direction
-        self.dy : float = dy  # velocity in y direction
+        # Velocity is coerced to float once here so per-tick math needs no conversions
+        self.dx : float = float(dx)  # velocity in x direction
+        self.dy : float = float(dy)  # velocity in y direction
         self.color = color
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
         self.last_attr_send_time = 0.0  # float seconds
+        self.last_send_tick : int = -(2 ** 31)  # simulation tick of the last send (far past: never sent)
+        # State as of the last attribute update sent; remote federates extrapolate from it
+        self.last_sent_x : float = x
+        self.last_sent_y : float = y
+        self.last_sent_dx : float = self.dx
+        self.last_sent_dy : float = self.dy
+        self.last_sent_scale : int = scale
+        self.last_sent_color = color
         self.is_owned = False
         self.object_handle : ObjectInstanceHandle
+        # (dx, dy, speed, direction) for the velocity speed/direction were last derived from
+        self._motion_cache : tuple[float, float, float, float] | None = None
         
-    def update_position(self, dt: float):
+    def update_position(self, dt: float, now: float | None = None):
         """
             Advance position using current velocity over a timestep.
 
             Args:
                 dt (float): Time delta in seconds.
+                now (float | None): Tick timestamp shared by all balls; read from the clock when omitted.
             Side Effects:
                 Updates x, y and last_update_time.
         """
         self.x += float(self.dx * dt)
         self.y += float(self.dy * dt)
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter() if now is None else now
         
     def bounce_x(self):
         """
@@ -63,19 +76,20 @@ class Ball:
         """
         self.dy = -self.dy
         
-    def set_position(self, x: int, y: int):
+    def set_position(self, x: int, y: int, now: float | None = None):
         """
             Assign absolute position values and refresh update timestamp.
 
             Args:
                 x (int): New X coordinate.
                 y (int): New Y coordinate.
+                now (float | None): Caller's timestamp; read from the clock when omitted.
             Side Effects:
                 Updates x, y, last_update_time.
         """
         self.x = x
         self.y = y
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter() if now is None else now
         
     def set_velocity(self, dx: float, dy: float):
         """
@@ -85,9 +99,66 @@ class Ball:
                 dx (float): New horizontal velocity.
                 dy (float): New vertical velocity.
         """
-        self.dx = dx
-        self.dy = dy
-        
+        self.dx = float(dx)
+        self.dy = float(dy)
+
+    def speed_and_direction(self) -> tuple[float, float]:
+        """
+            Speed magnitude and direction (radians, atan2 convention) of the current velocity.
+
+            Returns:
+                tuple[float, float]: (speed, direction).
+            Notes:
+                Cached per velocity. A wall bounce only negates dx and/or dy, which leaves speed unchanged
+                and reflects the direction, so that case is derived without sqrt/atan2.
+        """
+        dx = self.dx
+        dy = self.dy
+        cache = self._motion_cache
+        if cache is not None:
+            cached_dx, cached_dy, speed, direction = cache
+            if dx == cached_dx and dy == cached_dy:
+                return speed, direction
+            if dx == -cached_dx and dy == cached_dy:
+                direction = math.pi - direction
+            elif dx == cached_dx and dy == -cached_dy:
+                direction = -direction
+            elif dx == -cached_dx and dy == -cached_dy:
+                direction = direction + math.pi
+            else:
+                cache = None
+            if cache is not None:
+                # Keep within atan2's (-pi, pi] range
+                if direction > math.pi:
+                    direction -= 2.0 * math.pi
+                elif direction <= -math.pi:
+                    direction += 2.0 * math.pi
+        if cache is None:
+            speed = math.hypot(dx, dy)
+            direction = math.atan2(dy, dx)
+        self._motion_cache = (dx, dy, speed, direction)
+        return speed, direction
+
+    def mark_sent(self, send_time: float, send_tick: int | None = None):
+        """
+            Record the current state as the last state published to the federation.
+
+            Args:
+                send_time (float): Time the attribute update was sent (seconds).
+                send_tick (int | None): Simulation tick of the send, when sent from the simulation loop.
+            Side Effects:
+                Updates last_attr_send_time, last_send_tick and the last_sent_* snapshot.
+        """
+        self.last_attr_send_time = send_time
+        if send_tick is not None:
+            self.last_send_tick = send_tick
+        self.last_sent_x = self.x
+        self.last_sent_y = self.y
+        self.last_sent_dx = self.dx
+        self.last_sent_dy = self.dy
+        self.last_sent_scale = self.scale
+        self.last_sent_color = self.color
+
     def __str__(self):
         """
             Human-readable summary of ball state (id, position, velocity, color).
@@ -110,6 +181,9 @@ class BallMap:
         self.balls: Dict[str, Ball] = {}
         self.local_balls: Dict[str, Ball] = {}  # Balls owned by this federate
         self.remote_balls: Dict[str, Ball] = {}  # Balls from other federates
+        # Ids removed since the last take_removed_ids(); None until a consumer enables tracking, so
+        # a headless run does not accumulate ids nobody drains
+        self._removed_ids: Optional[Set[str]] = None
         
     def add_ball(self, ball: Ball, is_local: bool = False):
         """
@@ -121,6 +195,10 @@ class BallMap:
             Side Effects:
                 Updates internal dictionaries; sets ball.is_owned.
         """
+        previous = self.balls.get(ball.ball_id)
+        if previous is not None and previous.is_owned != is_local:
+            # Same id re-added with the other ownership; drop it from the side it no longer belongs to
+            (self.local_balls if previous.is_owned else self.remote_balls).pop(ball.ball_id, None)
         self.balls[ball.ball_id] = ball
         if is_local:
             self.local_balls[ball.ball_id] = ball
@@ -138,12 +216,12 @@ class BallMap:
             Side Effects:
                 Internal maps updated; silent if ID absent.
         """
-        if ball_id in self.balls:
-            del self.balls[ball_id]
-        if ball_id in self.local_balls:
-            del self.local_balls[ball_id]
-        if ball_id in self.remote_balls:
-            del self.remote_balls[ball_id]
+        # Ownership says which side map holds the ball, so only two maps are touched
+        ball = self.balls.pop(ball_id, None)
+        if ball is not None:
+            (self.local_balls if ball.is_owned else self.remote_balls).pop(ball_id, None)
+            if self._removed_ids is not None:
+                self._removed_ids.add(ball_id)
             
     def get_ball(self, ball_id: str) -> Optional[Ball]:
         """
@@ -163,10 +241,35 @@ class BallMap:
             Side Effects:
                 Empties internal dictionaries.
         """
+        if self._removed_ids is not None:
+            self._removed_ids.update(self.balls)
         self.balls.clear()
         self.local_balls.clear()
         self.remote_balls.clear()
         
+    def track_removals(self):
+        """
+            Start recording removed ball ids for take_removed_ids().
+
+            Side Effects:
+                Enables removal tracking; a no-op if already enabled.
+        """
+        if self._removed_ids is None:
+            self._removed_ids = set()
+
+    def take_removed_ids(self) -> AbstractSet[str]:
+        """
+            Return the ids removed since the previous call and reset the record.
+
+            Returns:
+                AbstractSet[str]: Removed ball ids (empty if none, or if tracking is not enabled).
+        """
+        removed = self._removed_ids
+        if not removed:
+            return frozenset()
+        self._removed_ids = set()
+        return removed
+
     def __len__(self):
         """
             Return total number of balls tracked.
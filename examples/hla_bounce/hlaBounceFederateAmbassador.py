@@ -4,6 +4,7 @@
 """
 import math
 import struct
+from functools import lru_cache
 from libsrc.rtiUtil.logger import *
 from examples.hla_bounce.ballData import Ball
 from HLA1516_2025.RTI.federateData import FederateData
@@ -11,22 +12,61 @@ from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador
 from HLA1516_2025.RTI.typedefs import AttributeHandleValueMap, FederationExecutionInformationVector, ParameterHandleValueMap
 from HLA1516_2025.RTI.handles import InteractionClassHandle, ObjectInstanceHandle, ObjectClassHandle, FederateHandle, TransportationTypeHandle
 
+# Prebound big-endian decoders for the Ball attribute encodings; unpack_from reads the leading bytes of
+# any buffer (bytes or memoryview) without an exact-length check, so callers never need to slice
+_UNPACK_BYTE = struct.Struct(">B").unpack_from
+_UNPACK_SHORT = struct.Struct(">h").unpack_from
+_UNPACK_DOUBLE = struct.Struct(">d").unpack_from
+
+# Locations are sent relative to the world centre
+_LOCATION_OFFSET = 250
+
+def _decode_byte(value: bytes, _unpack=_UNPACK_BYTE) -> int:
+    return _unpack(value)[0]
+
+def _decode_short(value: bytes, _unpack=_UNPACK_SHORT) -> int:
+    return _unpack(value)[0]
+
+def _decode_double(value: bytes, _unpack=_UNPACK_DOUBLE) -> float:
+    return _unpack(value)[0]
+
+def _decode_location(value: bytes, _unpack=_UNPACK_SHORT, _offset=_LOCATION_OFFSET) -> int:
+    return _unpack(value)[0] + _offset
+
+# Ball attribute name -> (slot in the per-reflection field list, decoder returning the final field value)
+_COLOR, _SIZE, _X, _Y, _SPEED, _DIRECTION = range(6)
+_BALL_ATTR_DECODERS = {
+    "Color": (_COLOR, _decode_byte),
+    "Size": (_SIZE, _decode_short),
+    "XLocation": (_X, _decode_location),
+    "YLocation": (_Y, _decode_location),
+    "Speed": (_SPEED, _decode_short),
+    "Direction": (_DIRECTION, _decode_double),
+}
+
+@lru_cache(maxsize=1024)
+def _direction_vector(direction: float) -> tuple[float, float]:
+    """Unit (cos, sin) of a heading; a ball keeps its heading between bounces, so most reflections repeat one."""
+    return math.cos(direction), math.sin(direction)
+
 class HlaBounceFederateAmbassador(FederateAmbassador):
     """
         Federate Ambassador wrapper for Federate Protocol operation.
     """
-    def __init__(self, ball_controller, data : FederateData = FederateData()):
+    def __init__(self, ball_controller, data : FederateData | None = None):
         """
             Construct a federate ambassador wrapper around shared federate state.
 
             Args:
                 ball_controller: Controller providing ball management interface.
-                data (FederateData): Optional pre-existing federate data container.
+                data (FederateData): Optional pre-existing federate data container (new one if omitted).
             Side Effects:
-                Associates provided (or default) data with ambassador via self.my_data.
+                Associates provided (or new) data with ambassador via self.my_data.
         """
         super().__init__(data)
         self.my_ball_controller = ball_controller
+        # Decoded reflection fields awaiting flush_reflects(), per ball id (see _COLOR.._DIRECTION)
+        self.my_pending_reflects : dict[str, list] = {}
 
     def connectionLost(self, fault_description: str) -> None:
         """
@@ -38,7 +78,7 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
                 Sets connection lost indicator.
         """
         log_incoming(f"Cause of connection loss: {fault_description}")
-        self.my_connection_lost = True
+        self.my_data.my_connection_lost = True
 
     def reportFederationExecutions(self, report: FederationExecutionInformationVector) -> None:
         """
@@ -101,8 +141,9 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Sets flags name_reservation_returned and my_name_reservation_succeeded True.
         """
-        self.my_data.name_reservation_returned = True
-        self.my_data.my_name_reservation_succeeded = True
+        data = self.my_data
+        data.name_reservation_returned = True
+        data.my_name_reservation_succeeded = True
         log_incoming(f"Object name reservation succeeded: {the_object_name}")
 
     def objectInstanceNameReservationFailed(self, the_object_name: str) -> None:
@@ -114,8 +155,9 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Sets name_reservation_returned True and my_name_reservation_succeeded False.
         """
-        self.my_data.name_reservation_returned = True
-        self.my_data.my_name_reservation_succeeded = False
+        data = self.my_data
+        data.name_reservation_returned = True
+        data.my_name_reservation_succeeded = False
         log_incoming(f"Object name reservation failed: {the_object_name}")
 
     def discoverObjectInstance(self, instance_handle : ObjectInstanceHandle,  class_handle : ObjectClassHandle, object_name : str, producing_federate : FederateHandle) -> None:
@@ -130,15 +172,17 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates shared data maps for name/handle/class lookups.
         """
-        self.my_data.my_object_instance_name_handles.setdefault(producing_federate, {})
-        self.my_data.my_object_instance_name_handles[producing_federate][object_name] = (instance_handle, class_handle)
-
-        self.my_data.my_object_instance_handle_names.setdefault(producing_federate, {})
-        self.my_data.my_object_instance_handle_names[producing_federate].setdefault(instance_handle, object_name)
+        data = self.my_data
+        # Discovery is the canonical point where these are set; the per-federate maps are defaultdicts
+        data.my_object_instance_name_handles[producing_federate][object_name] = (instance_handle, class_handle)
+        data.my_object_instance_handle_names[producing_federate][instance_handle] = object_name
         # Direct lookup to enable quick reflection mapping
-        self.my_data.my_object_instance_classes[instance_handle] = class_handle
-        self.my_data.my_object_instance_attrs[instance_handle] = {}
-        log_incoming(f"Discovered Object Instance: {instance_handle}, Class: {class_handle}, Name: {object_name}, Producing Federate: {producing_federate}")
+        data.my_object_instance_classes[instance_handle] = class_handle
+        data.my_object_instance_names[instance_handle] = object_name
+        data.my_object_instance_attrs[instance_handle] = {}
+        # A re-used handle is live again
+        data.my_removed_instances.discard(instance_handle)
+        log_incoming("Discovered Object Instance: %s, Class: %s, Name: %s, Producing Federate: %s", instance_handle, class_handle, object_name, producing_federate)
 
     def removeObjectInstance(self, object_instance_handle: ObjectInstanceHandle, _user_tag: bytes, producing_federate: FederateHandle) -> None:
         """
@@ -151,24 +195,24 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates removal tracking set and cleans associated name/class mappings.
         """
-        removed = getattr(self.my_data, 'my_removed_instances', None)
-        if removed is None:
-            removed = set()
-            setattr(self.my_data, 'my_removed_instances', removed)
-        removed.add(object_instance_handle)
-        # Cleanup name maps if present
-        handle_to_name = self.my_data.my_object_instance_handle_names.get(producing_federate)
-        if handle_to_name and object_instance_handle in handle_to_name:
-            name = handle_to_name.pop(object_instance_handle)
-            name_to_handles = self.my_data.my_object_instance_name_handles.get(producing_federate)
+        data = self.my_data
+        data.my_removed_instances.add(object_instance_handle)
+        # Cleanup name maps if present (pop with a default instead of a membership test first)
+        handle_to_name = data.my_object_instance_handle_names.get(producing_federate)
+        name = handle_to_name.pop(object_instance_handle, None) if handle_to_name else None
+        if name is not None:
+            # A reflection still queued for this instance must not re-create it on the next flush
+            self.my_pending_reflects.pop(name, None)
+            name_to_handles = data.my_object_instance_name_handles.get(producing_federate)
             #remove from handle names
             if name_to_handles:
                 name_to_handles.pop(name, None)
-        # Clean direct class map
-        if object_instance_handle in self.my_data.my_object_instance_classes:
-            self.my_data.my_object_instance_classes.pop(object_instance_handle, None)
+        # Clean direct class, name and reflected-value maps
+        data.my_object_instance_classes.pop(object_instance_handle, None)
+        data.my_object_instance_names.pop(object_instance_handle, None)
+        data.my_object_instance_attrs.pop(object_instance_handle, None)
 
-        log_incoming(f"Removed Object Instance: {object_instance_handle}, Producing Federate: {producing_federate}")
+        log_incoming("Removed Object Instance: %s, Producing Federate: %s", object_instance_handle, producing_federate)
 
     def receiveInteraction(self, interaction_class_handle : InteractionClassHandle, parameters: ParameterHandleValueMap, user_tag: bytes, transport_type : TransportationTypeHandle, producing_federate : FederateHandle) -> None:
         """
@@ -181,16 +225,40 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
                 producing_federate (FederateHandle): Origin federate.
                 parameters (dict | protobuf wrapper): Provides ListFields() of parameter entries.
             Side Effects:
-                Populates nested my_interaction_parameter_values map with raw parameter bytes.
+                Populates my_interaction_parameter_values keyed by (federate, interaction class, parameter) with raw parameter bytes.
         """
-        log_incoming(f"receiveInteraction - interaction class handle: {interaction_class_handle}, user_tag: {user_tag}, transport_type: {transport_type}, producing_federate: {producing_federate}")
+        log_incoming("receiveInteraction - interaction class handle: %s, user_tag: %s, transport_type: %s, producing_federate: %s", interaction_class_handle, user_tag, transport_type, producing_federate)
         log_incoming("Parameters:")
         # Grabbing the first descriptor/field-descriptor pairs for ParameterHandleValueMap (We only expect one)
         handle_values = parameters.items()
+        parameter_values = self.my_data.my_interaction_parameter_values
         for handle, value in handle_values:
             # Process each attribute value 
-            log_incoming(f"   handle: {handle}, value: {value}")
-            self.my_data.my_interaction_parameter_values[producing_federate][interaction_class_handle][handle] = value
+            log_incoming("   handle: %s, value: %s", handle, value)
+            parameter_values[(producing_federate, interaction_class_handle, handle)] = value
+
+    def _attr_dispatch(self, class_handle: ObjectClassHandle) -> dict:
+        """
+            Return the reflection decode table for an object class, building it on first use.
+
+            Args:
+                class_handle (ObjectClassHandle): Class of the reflected instance.
+            Returns:
+                dict[AttributeHandle, tuple[int, Callable]]: Attribute handle -> (field slot, decoder) for the known Ball attributes.
+            Side Effects:
+                Caches the table in my_data.my_attr_dispatch once the class's attribute handles are known.
+        """
+        data = self.my_data
+        dispatch = data.my_attr_dispatch.get(class_handle)
+        if dispatch is None:
+            dispatch = {
+                handle: _BALL_ATTR_DECODERS[name]
+                for handle, name in data.my_attr_handle_names.get(class_handle, {}).items()
+                if name in _BALL_ATTR_DECODERS
+            }
+            if dispatch:
+                data.my_attr_dispatch[class_handle] = dispatch
+        return dispatch
 
     def reflectAttributeValues(self, object_instance_handle: ObjectInstanceHandle, attributes: AttributeHandleValueMap, user_tag: bytes, transport_type: TransportationTypeHandle, producing_federate: FederateHandle) -> None:
         """
@@ -205,64 +273,77 @@ class HlaBounceFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates my_object_instance_attrs with attribute handle -> raw value mapping.
         """
-        log_incoming(f"reflectAttributeValues - object instance handle: {object_instance_handle}, user_tag: {user_tag}, transport_type: {transport_type}, producing_federate: {producing_federate}")
-        # Process each attribute value
-        log_incoming("Attributes:")
-        if len(self.my_data.my_object_instance_attrs) is 0:
-            self.my_data.my_object_instance_attrs[object_instance_handle] = {}
-        temp_ball : Ball = Ball("")
-        direction_first : tuple[bool, float] = (False, -1.0)
-        speed_first : tuple[bool, float] = (False, -1.0)
+        log_incoming("reflectAttributeValues - object instance handle: %s, user_tag: %s, transport_type: %s, producing_federate: %s, attributes: %d",
+                     object_instance_handle, user_tag, transport_type, producing_federate, len(attributes))
+        data = self.my_data
+        # Late reflection racing a removal: nothing left to update
+        if object_instance_handle in data.my_removed_instances:
+            return
+        # Resolve the per-instance containers once, outside the attribute loop
+        instance_attrs = data.my_object_instance_attrs[object_instance_handle]
+        dispatch = self._attr_dispatch(data.my_object_instance_classes[object_instance_handle])
+        ball_id = data.my_object_instance_names[object_instance_handle]
+        # Decoded values by field slot, applied to the ball by flush_reflects() once per tick; a later
+        # reflection of the same ball in the same tick overwrites only the fields it carries
+        fields = self.my_pending_reflects.get(ball_id)
+        if fields is None:
+            fields = self.my_pending_reflects[ball_id] = [None] * 6
         for handle, value in attributes.items():
-            self.my_data.my_object_instance_attrs[object_instance_handle][handle] = value
-            attr_name = self.my_data.my_attr_handle_names[self.my_data.my_object_instance_classes[object_instance_handle]][handle]
-            match attr_name:
-                case "Direction":
-                    output = struct.unpack(">d", value)[0]
-                    if speed_first[0]:
-                        temp_ball.dx = speed_first[1] * math.cos(output)
-                        temp_ball.dy = speed_first[1] * math.sin(output)
-                        print(f"Received direction: {output}, resulting in dx: {temp_ball.dx}, dy: {temp_ball.dy}")
-                    else:
-                        direction_first = (True, output)
-                        print(f"Received direction: {output}, waiting for speed")
-                case "Speed":
-                    output = float(struct.unpack(">h", value)[0])
-                    if direction_first[0]:
-                        temp_ball.dx = output * math.cos(direction_first[1])
-                        temp_ball.dy = output * math.sin(direction_first[1])
-                        print(f"Received speed: {output}, resulting in dx: {temp_ball.dx}, dy: {temp_ball.dy}")
-                    else:
-                        speed_first = (True, output)
-                        print(f"Received speed: {output}, waiting for direction")
-                case "XLocation":
-                    temp_ball.x = (struct.unpack(">h", value)[0]) + 250
-                    print(f"Received x location: {temp_ball.x}")
-                case "YLocation":
-                    temp_ball.y = (struct.unpack(">h", value)[0]) + 250
-                    print(f"Received y location: {temp_ball.y}")
-                case "Color":
-                    temp_ball.color = struct.unpack(">B", value)[0]
-                    print(f"Received color: {temp_ball.color}")
-                case "Size":
-                    temp_ball.scale = struct.unpack(">h", value)[0]
-                    print(f"Received size: {temp_ball.scale}")
-                case _:
-                    pass
-        temp_ball.ball_id = self.my_data.my_object_instance_handle_names[producing_federate][object_instance_handle]
-        print(temp_ball.ball_id)
-        fresh_Ball = self.my_ball_controller.ball_data.get_ball(temp_ball.ball_id)
-        if fresh_Ball is None:
-            # Create new remote Ball if it doesn't exist
-            self.my_ball_controller.ball_data.add_ball(temp_ball, is_local=False)
-            log_incoming(f"Received new remote Ball {temp_ball.ball_id}")
-            fresh_Ball = temp_ball
-            self.my_ball_controller.list_refresh_needed = True
-        else:
-            fresh_Ball.x = temp_ball.x
-            fresh_Ball.y = temp_ball.y
-            fresh_Ball.dx = temp_ball.dx
-            fresh_Ball.dy = temp_ball.dy
-            fresh_Ball.color = temp_ball.color
-            fresh_Ball.ball_id = temp_ball.ball_id
+            instance_attrs[handle] = value
+            entry = dispatch.get(handle)
+            if entry is not None:
+                fields[entry[0]] = entry[1](value)
+        if debug_enabled():
+            log_debug("Received ball state %s: color, size, x, y, speed, direction = %s", ball_id, fields)
+
+    def flush_reflects(self) -> int:
+        """
+            Apply queued reflections to the controller's ball map in one pass.
+
+            Returns:
+                int: Number of balls updated or created.
+            Side Effects:
+                Creates remote Balls for unseen ids, writes the reflected fields straight into known ones,
+                sets the controller's list_refresh_needed once if any ball was created, and empties the queue.
+        """
+        pending = self.my_pending_reflects
+        if not pending:
+            return 0
+        ball_controller = self.my_ball_controller
+        ball_data = ball_controller.ball_data
+        created = False
+        for ball_id, (color, size, x, y, speed, direction) in pending.items():
+            # Known balls (the steady state) are updated in place; only unseen ids allocate a Ball
+            ball = ball_data.get_ball(ball_id)
+            new = ball is None
+            if new:
+                ball = Ball(ball_id)
+            if x is not None:
+                ball.x = x
+            if y is not None:
+                ball.y = y
+            if color is not None:
+                ball.color = color
+            if size is not None:
+                ball.scale = size
+            # Speed and Direction are combined into dx/dy once, after decoding; an update carrying only one
+            # of them keeps the other from the ball's current velocity
+            if speed is not None or direction is not None:
+                if speed is None:
+                    speed = ball.speed_and_direction()[0]
+                elif direction is None:
+                    direction = ball.speed_and_direction()[1]
+                cos_d, sin_d = _direction_vector(direction)
+                ball.dx = speed * cos_d
+                ball.dy = speed * sin_d
+            if new:
+                # Create new remote Ball if it doesn't exist
+                ball_data.add_ball(ball, is_local=False)
+                log_incoming("Received new remote Ball %s", ball_id)
+                created = True
+        count = len(pending)
+        pending.clear()
+        if created:
+            ball_controller.list_refresh_needed = True
+        return count
 
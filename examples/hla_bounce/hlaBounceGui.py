@@ -4,16 +4,17 @@
 """
 import os
 import time
+from bisect import bisect_left
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox,
-    QTextEdit, QSplitter, QAction, QListWidget, QGroupBox, QDialog,
+    QTextEdit, QSplitter, QAction, QListWidget, QListWidgetItem, QGroupBox, QDialog,
     QDialogButtonBox, QMessageBox, QWidgetAction, QDoubleSpinBox,
-    QComboBox, QGraphicsView, QGraphicsScene
+    QComboBox, QGraphicsView, QGraphicsScene, QGraphicsItem
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtSvg import QGraphicsSvgItem
+from PyQt5.QtSvg import QGraphicsSvgItem, QSvgRenderer
 
 from examples.hla_bounce.ballController import BallController
 from examples.hla_bounce.ballData import BallMap
@@ -37,8 +38,16 @@ class BallCanvas(QGraphicsView):
         self.world_width = world_width
         self.world_height = world_height
         self.scene_obj = QGraphicsScene(0, 0, self.world_width, self.world_height, self)
+        # Every ball moves every frame, so a BSP index would be rebuilt constantly for no lookup benefit
+        self.scene_obj.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene_obj)
+        # Repaint only the dirty item regions; ball items restore their own painter state and are not antialiased,
+        # so the per-item save/restore and antialiasing margins are skipped
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
         self._items: dict[str, QGraphicsSvgItem] = {}
+        # Removals are handed over by the BallMap instead of diffing every id each frame
+        self.my_Ball_data.track_removals()
         self._icons = {
             0: "ObjectSphereRed.svg",
             1: "ObjectSphereBlue.svg",
@@ -47,19 +56,39 @@ class BallCanvas(QGraphicsView):
             4: "ObjectSphereViolet.svg",
             5: "ObjectSphereAqua.svg",
         }
+        # One parsed SVG per color, shared by every ball item of that color, with its unscaled half width/height
+        self._renderers: dict[int, tuple[QSvgRenderer, float, float]] = {}
 
-    def _new_item(self, color_index: int) -> QGraphicsSvgItem:
+    def _new_item(self, color_index: int, size: int) -> QGraphicsSvgItem:
         """
-            Create a new SVG item for a ball of the given color index.
+            Create a new SVG item for a ball of the given color index and size.
 
             Args:
                 color_index (int): Color index for the ball (0-5).
+                size (int): Ball scale factor, in percent of the icon size.
             Returns:
                 QGraphicsSvgItem: The created SVG item.
-        """
-        fn = self._icons.get(color_index, "ObjectSphereRed.svg")
-        it = QGraphicsSvgItem(ICON_PREAMBLE + fn)
+            Notes:
+                Item data: 0 = color index, 1/2 = scaled half width/height (for _place_item), 3 = size.
+        """
+        shared = self._renderers.get(color_index)
+        if shared is None:
+            fn = self._icons.get(color_index, "ObjectSphereRed.svg")
+            renderer = QSvgRenderer(ICON_PREAMBLE + fn, self)
+            # An item's bounding rect is the renderer's default size, which never changes
+            default_size = renderer.defaultSize()
+            shared = self._renderers[color_index] = (renderer, default_size.width() / 2.0, default_size.height() / 2.0)
+        renderer, half_w, half_h = shared
+        it = QGraphicsSvgItem()
+        it.setSharedRenderer(renderer)
+        # Rasterize once per device transform and blit the pixmap on later repaints
+        it.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        scale = size / 100.0
+        it.setScale(scale)
         it.setData(0, color_index)
+        it.setData(1, half_w * scale)
+        it.setData(2, half_h * scale)
+        it.setData(3, size)
         return it
 
     def _place_item(self, item: QGraphicsSvgItem, x: float, y: float):
@@ -71,34 +100,40 @@ class BallCanvas(QGraphicsView):
                 x (float): The X coordinate to center the item.
                 y (float): The Y coordinate to center the item.
             Side Effects:
-                Updates the item's position.
+                Updates the item's position; an item already in place is left untouched so it is not marked dirty.
         """
-        br = item.boundingRect()
-        w = br.width() * item.scale()
-        h = br.height() * item.scale()
-        item.setPos(x - w/2.0, y - h/2.0)
+        # Half extents were cached on the item when it was created
+        px = x - item.data(1)
+        py = y - item.data(2)
+        if item.x() != px or item.y() != py:
+            item.setPos(px, py)
 
     def sync_from_data(self):
         """
             Sync the scene items from the ball data.
 
             Adds new items, updates existing ones, and removes deleted ones.
-        """
-        # Remove deleted
-        ids_live = set(self.my_Ball_data.balls.keys())
-        for bid in list(self._items.keys() - ids_live):
-            itm = self._items.pop(bid)
-            self.scene_obj.removeItem(itm)
-        # Upsert
-        for bid, b in self.my_Ball_data.balls.items():
-            item = self._items.get(bid)
-            if item is None or item.data(0) != b.color:
+            Notes:
+                No explicit repaint is requested: the scene records the old and new regions of every item
+                added, removed or moved here and repaints their union once, on its next update pass.
+        """
+        ball_data = self.my_Ball_data
+        items = self._items
+        scene = self.scene_obj
+        # Remove deleted (only the ids the BallMap reports removed since the last sync)
+        for bid in ball_data.take_removed_ids():
+            itm = items.pop(bid, None)
+            if itm is not None:
+                scene.removeItem(itm)
+        # Upsert; every ball is visited because simulation and extrapolation move all of them each tick
+        for bid, b in ball_data.balls.items():
+            item = items.get(bid)
+            if item is None or item.data(0) != b.color or item.data(3) != b.scale:
                 if item is not None:
-                    self.scene_obj.removeItem(item)
-                item = self._new_item(getattr(b, 'color', 0))
-                item.setScale(b.scale / 100.0)
-                self.scene_obj.addItem(item)
-                self._items[bid] = item
+                    scene.removeItem(item)
+                item = self._new_item(getattr(b, 'color', 0), b.scale)
+                scene.addItem(item)
+                items[bid] = item
             self._place_item(item, float(getattr(b, 'x', 0.0)), float(getattr(b, 'y', 0.0)))
 
     def resizeEvent(self, event):
@@ -141,18 +176,6 @@ class BallCanvas(QGraphicsView):
         except Exception:
             self.fitInView(rect, 1)
 
-    def paintEvent(self, event):
-        """
-            On paint, sync items from data before painting.
-
-            Args:
-                event (QPaintEvent): The paint event.
-            Side Effects:
-                Updates the view transform.
-        """
-        self.sync_from_data()
-        super().paintEvent(event)
-
 
 
 class HlaBounceGui(QMainWindow):
@@ -184,7 +207,6 @@ class HlaBounceGui(QMainWindow):
         self.my_ball_counter = 0
         self.my_object_subpub = True
         self.hla_connected = False
-        self.last_update_time = time.time()
 
         # Instance copies of defaults (change these through UI)
         self.default_speed: float = self.DEFAULT_SPEED
@@ -222,6 +244,9 @@ class HlaBounceGui(QMainWindow):
         self.local_list.setMinimumWidth(140)
         self.remote_list_label = QLabel("Remote Objects")
         self.remote_list = QListWidget()
+        # Rows currently shown per ball id, so refreshes only add/take the ids that changed
+        self._local_rows: dict[str, QListWidgetItem] = {}
+        self._remote_rows: dict[str, QListWidgetItem] = {}
         for label, lst in ((self.local_list_label, self.local_list), (self.remote_list_label, self.remote_list)):
             box = QVBoxLayout()
             box.addWidget(label)
@@ -259,23 +284,17 @@ class HlaBounceGui(QMainWindow):
         # Menus
         self._create_menus()
 
-        # UI repaint/update timer (decoupled from simulation logic)
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(16)  # ~60 FPS
-        # Simulation timer (match ~60 Hz)
+        # The single GUI timer (~60 Hz): each tick evokes HLA callbacks, steps physics, sends the batched
+        # attribute updates and then refreshes the display, so the event loop wakes once per frame
         self.sim_timer = QTimer(self)
+        self.sim_timer.setTimerType(Qt.PreciseTimer)
         self.sim_timer.timeout.connect(self._update_simulation)
         self.sim_timer.start(16)  # ~60 Hz physics
-        # High-frequency non-blocking HLA pump (network callbacks)
-        self.hla_pump_timer = QTimer(self)
-        self.hla_pump_timer.timeout.connect(self.controller.pump_hla)
-        self.hla_pump_timer.start(20)  # 50 Hz lightweight pump (sufficient)
+        # Tick rate handed to run_tick, recomputed only when the interval changes
+        self.tick_hz = 1000.0 / 16
 
         # State variables (redundant but explicit)
         self.hla_connected = False
-        self._time_func = time.perf_counter
-        self.last_update_time = self._time_func()
 
         self.log_message("GUI initialized")
 
@@ -459,20 +478,22 @@ class HlaBounceGui(QMainWindow):
 
     def _change_fps(self, fps: int):
         """
-            Adjust the UI update timer interval based on the requested frames-per-second value.
+            Adjust the tick timer interval based on the requested frames-per-second value.
 
             Args:
                 fps (int): Desired display refresh rate (frames per second).
             Side Effects:
-                Updates internal QTimer interval controlling redraw cadence.
+                Updates the QTimer interval driving both simulation ticks and redraws; attribute updates
+                keep their rate because run_tick derives the send throttle from the interval.
         """
-        if not hasattr(self, "update_timer") or self.update_timer is None:
+        if not hasattr(self, "sim_timer") or self.sim_timer is None:
             return
         if fps < 1:
             fps = 1
         interval_ms = int(1000 / fps)
-        if self.update_timer.interval() != interval_ms:
-            self.update_timer.setInterval(interval_ms)
+        if self.sim_timer.interval() != interval_ms:
+            self.sim_timer.setInterval(interval_ms)
+            self.tick_hz = 1000.0 / interval_ms
 
 # ---- Menu / Canvas action handlers ----
     def _connect_hla(self):
@@ -498,7 +519,9 @@ class HlaBounceGui(QMainWindow):
                 self.my_sub_pub_button.setEnabled(True)
                 self.my_connect_button.setEnabled(False)
                 self.log_message("✓ HLA connection successful")
-                self.sim_timer.start(25)
+                # Already ticking unless a previous disconnect stopped it; keep the current interval
+                if not self.sim_timer.isActive():
+                    self.sim_timer.start()
             else:
                 self.log_message("✗ HLA connection failed")
                 self.my_connect_button.setEnabled(True)
@@ -558,9 +581,6 @@ class HlaBounceGui(QMainWindow):
         
         try:
             self._stop_simulation()
-            # Stop RTI pump
-            if self.sim_timer.isActive():
-                self.sim_timer.stop()
             self.controller.cleanup()
             
             self.hla_connected = False
@@ -707,19 +727,17 @@ class HlaBounceGui(QMainWindow):
             Args:
                 None
             Side Effects:
-                Updates positions, refreshes object lists if needed, triggers display update.
+                Updates positions, refreshes object lists if needed, and refreshes the display every tick.
         """
-        current_time = getattr(self, '_time_func', time.perf_counter)()
-        dt = current_time - self.last_update_time
+        controller = self.controller
+        # The QTimer already paces ticks, so run_tick must not sleep inside the event loop
+        controller.run_tick(self.tick_hz, pace=False, simulate=self.my_object_subpub and self.hla_connected)
 
-        if self.controller.list_refresh_needed:
+        if controller.list_refresh_needed:
             self._refresh_object_lists()
-            self.controller.list_refresh_needed = False
+            controller.list_refresh_needed = False
 
-        if self.my_object_subpub and self.hla_connected:
-            self.last_update_time = current_time
-            self.controller.update_simulation(dt)
-            self._update_display()
+        self._update_display()
 
     def _update_display(self):
         """
@@ -728,11 +746,11 @@ class HlaBounceGui(QMainWindow):
             Args:
                 None
             Side Effects:
-                Repaints canvas and updates counts label; suppresses count errors silently.
+                Syncs canvas items (the scene repaints what changed) and updates counts label; suppresses count errors silently.
         """
+        # The single data -> scene synchronizer: painting itself never touches the ball data
         self.canvas.my_Ball_data = self.ball_data
         self.canvas.sync_from_data()
-        self.canvas.update()
         # Update counts label
         try:
             total = len(self.ball_data.balls)
@@ -762,16 +780,16 @@ class HlaBounceGui(QMainWindow):
 
     def _stop_simulation(self):
         """
-            Stop active timers to halt UI refresh, simulation stepping, and HLA pump.
+            Stop the tick timer to halt UI refresh, simulation stepping, and HLA pump.
 
             Args:
                 None
             Side Effects:
-                Stops QTimers if active.
+                Stops the QTimer if active.
         """
-        for t in (getattr(self, 'update_timer', None), getattr(self, 'sim_timer', None), getattr(self, 'hla_pump_timer', None)):
-            if t is not None and t.isActive():
-                t.stop()
+        t = getattr(self, 'sim_timer', None)
+        if t is not None and t.isActive():
+            t.stop()
 
     # ----------------- New default attribute handlers -----------------
     def _apply_defaults_all_local(self):
@@ -800,6 +818,38 @@ class HlaBounceGui(QMainWindow):
         self._update_display()
 
     # ----------------- Object list refresh helper -----------------
+    @staticmethod
+    def _sync_list(widget: QListWidget, rows: dict[str, QListWidgetItem], ids) -> None:
+        """
+            Bring one object list in line with a set of ball ids, keeping rows sorted by (length, id).
+
+            Args:
+                widget (QListWidget): List widget to update.
+                rows (dict[str, QListWidgetItem]): Ball id -> row item currently shown in the widget.
+                ids: Set-like view of the ball ids that should be shown.
+            Side Effects:
+                Takes rows for removed ids, inserts rows for new ids and updates rows to match.
+        """
+        removed = rows.keys() - ids
+        added = ids - rows.keys()
+        if not removed and not added:
+            return
+        widget.setUpdatesEnabled(False)
+        try:
+            for bid in removed:
+                widget.takeItem(widget.row(rows.pop(bid)))
+            # Rows are kept in sort order, so each new id is inserted at its bisected position
+            order = sorted((len(bid), bid) for bid in rows)
+            for bid in sorted(added, key=lambda x: (len(x), x)):
+                key = (len(bid), bid)
+                row = bisect_left(order, key)
+                order.insert(row, key)
+                item = QListWidgetItem(bid)
+                widget.insertItem(row, item)
+                rows[bid] = item
+        finally:
+            widget.setUpdatesEnabled(True)
+
     def _refresh_object_lists(self):
         """
             Update GUI list widgets showing local and remote ball IDs while preserving selection.
@@ -807,37 +857,13 @@ class HlaBounceGui(QMainWindow):
             Args:
                 None
             Side Effects:
-                Clears and repopulates QListWidgets; updates ball count label; suppresses minor errors.
+                Adds/takes only the rows whose ids appeared or disappeared; updates ball count label; suppresses minor errors.
         """
         if not hasattr(self, 'local_list') or not hasattr(self, 'remote_list'):
             return
-        # Preserve current selection ids (if any) to restore after refresh
-        cur_local_item = self.local_list.currentItem()
-        current_local = cur_local_item.text() if cur_local_item else None
-        cur_remote_item = self.remote_list.currentItem()
-        current_remote = cur_remote_item.text() if cur_remote_item else None
-        self.local_list.clear()
-        for bid in sorted(self.ball_data.local_balls.keys(), key=lambda x: (len(x), x)):
-            self.local_list.addItem(bid)
-        self.remote_list.clear()
-        for bid in sorted(self.ball_data.remote_balls.keys(), key=lambda x: (len(x), x)):
-            self.remote_list.addItem(bid)
-        # Restore selection if id still present
-        match_flag = getattr(Qt, 'MatchExactly', getattr(Qt, 'MatchFixedString', 0))
-        if current_local:
-            try:
-                matches = self.local_list.findItems(current_local, match_flag)
-            except Exception:
-                matches = []
-            if matches:
-                self.local_list.setCurrentItem(matches[0])
-        if current_remote:
-            try:
-                matches = self.remote_list.findItems(current_remote, match_flag)
-            except Exception:
-                matches = []
-            if matches:
-                self.remote_list.setCurrentItem(matches[0])
+        # Untouched rows keep their items, so the current selection survives without a lookup
+        self._sync_list(self.local_list, self._local_rows, self.ball_data.local_balls.keys())
+        self._sync_list(self.remote_list, self._remote_rows, self.ball_data.remote_balls.keys())
         # Update counts immediately
         if hasattr(self, 'Ball_count_label'):
             try:
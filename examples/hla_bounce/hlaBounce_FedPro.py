@@ -35,7 +35,8 @@ def main():
     gui.show()
     result = app.exec_()
     
-    # Cleanup (equivalent to C++ delete operations)
+    # Cleanup (equivalent to C++ delete operations); explicit, not left to the garbage collector
+    controller.cleanup()
     del controller
     del ball_data  
     del region_data
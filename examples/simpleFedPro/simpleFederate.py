@@ -150,6 +150,8 @@ class simpleFederate():
             self.my_data.my_attr_name_handles[air_object_class_handle] = {}
             self.my_data.my_attr_handle_names[ground_object_class_handle] = {}
             self.my_data.my_attr_handle_names[air_object_class_handle] = {}
+            for class_handle in (object_class_handle, ground_object_class_handle, air_object_class_handle):
+                self.my_data.my_attr_dispatch.pop(class_handle, None)
         except Exception as e:
             log_error(f"Failed to get object class handle for: {e}")
             return False
@@ -390,12 +392,12 @@ class simpleFederate():
         """
         try:
             # Get the published parameters we stored during registration
-            if self.my_rti_ambassador.my_parameter_name_handles == {}:
+            if not self.my_rti_ambassador.my_parameter_name_handles:
                 log_error("No Interaction Classes Published")
                 raise Exception("No Interaction Classes Published")
             
             for value, handle in self.my_rti_ambassador.my_interaction_name_handles.items():
-                if self.my_rti_ambassador.my_parameter_name_handles[handle].items() is not {}:
+                if self.my_rti_ambassador.my_parameter_name_handles.get(handle):
                     parameter_values : dict[handles.ParameterHandle, bytes] = {}
                     # Update some specific parameters with meaningful data
                     for param_name, param_handle in self.my_rti_ambassador.my_parameter_name_handles[handle].items():
@@ -423,11 +425,11 @@ class simpleFederate():
         try:
             current_time = time.time()
             # Get the published attributes we stored during registration
-            if self.my_object_instance_Handle_Values is {}:
+            if not self.my_object_instance_Handle_Values:
                 log_error("No Object Instances Registered")
                 raise Exception("No Object Instances Registered")
             
-            if self.my_object_instance_Handle_Values[object_instance_handle][1] == {}:
+            if not self.my_object_instance_Handle_Values[object_instance_handle][1]:
                 log_warning("Attribute initialization required")
                 for a,b in self.my_data.my_attr_name_handles[self.my_object_instance_Handle_Values[object_instance_handle][0]].items():
                     self.my_object_instance_Handle_Values[object_instance_handle][1][b] = b""
@@ -11,16 +11,16 @@ from HLA1516_2025.RTI.handles import AttributeHandle, InteractionClassHandle, Ob
 
 class SimpleFederateAmbassador(FederateAmbassador):
     """Federate Ambassador wrapper for Federate Protocol operation."""
-    def __init__(self, data : FederateData = FederateData()):
+    def __init__(self, data : FederateData | None = None):
         """
             Construct a federate ambassador wrapper around shared federate state.
 
             Args:
                 data (FederateData): Optional pre-existing state container (new one if omitted).
             Side Effects:
-                Associates provided (or default) data with ambassador via self.my_data.
+                Associates provided (or new) data with ambassador via self.my_data.
         """
-        self.my_data = data
+        super().__init__(data)
 
     def connectionLost(self, fault_description: str) -> None:
         """
@@ -32,7 +32,7 @@ class SimpleFederateAmbassador(FederateAmbassador):
                 Sets connection lost indicator.
         """
         log_incoming(f"Cause of connection loss: {fault_description}")
-        self.my_connection_lost = True
+        self.my_data.my_connection_lost = True
 
     def reportFederationExecutions(self, report: FederationExecutionInformationVector) -> None:
         """
@@ -95,8 +95,9 @@ class SimpleFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Sets name_reservation_returned and my_name_reservation_succeeded True.
         """
-        self.my_data.name_reservation_returned = True
-        self.my_data.my_name_reservation_succeeded = True
+        data = self.my_data
+        data.name_reservation_returned = True
+        data.my_name_reservation_succeeded = True
         log_incoming(f"Object name reservation succeeded: {the_object_name}")
 
     def objectInstanceNameReservationFailed(self, the_object_name: str) -> None:
@@ -108,8 +109,9 @@ class SimpleFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Sets name_reservation_returned True and my_name_reservation_succeeded False.
         """
-        self.my_data.name_reservation_returned = True
-        self.my_data.my_name_reservation_succeeded = False
+        data = self.my_data
+        data.name_reservation_returned = True
+        data.my_name_reservation_succeeded = False
         log_incoming(f"Object name reservation failed: {the_object_name}")
 
     def discoverObjectInstance(self, instance_handle : ObjectInstanceHandle,  class_handle : ObjectClassHandle, object_name : str, producing_federate : FederateHandle) -> None:
@@ -124,14 +126,14 @@ class SimpleFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates shared data maps for name/handle/class lookups.
         """
-        self.my_data.my_object_instance_name_handles.setdefault(producing_federate, {})
-        self.my_data.my_object_instance_name_handles[producing_federate][object_name] = (instance_handle, class_handle)
+        data = self.my_data
+        data.my_object_instance_name_handles[producing_federate][object_name] = (instance_handle, class_handle)
 
-        self.my_data.my_object_instance_handle_names.setdefault(producing_federate, {})
-        self.my_data.my_object_instance_handle_names[producing_federate].setdefault(instance_handle, object_name)
+        data.my_object_instance_handle_names[producing_federate][instance_handle] = object_name
         # Direct lookup to enable quick reflection mapping
-        self.my_data.my_object_instance_classes[instance_handle] = class_handle
-        log_incoming(f"Discovered Object Instance: {instance_handle}, Class: {class_handle}, Name: {object_name}, Producing Federate: {producing_federate}")
+        data.my_object_instance_classes[instance_handle] = class_handle
+        data.my_removed_instances.discard(instance_handle)
+        log_incoming("Discovered Object Instance: %s, Class: %s, Name: %s, Producing Federate: %s", instance_handle, class_handle, object_name, producing_federate)
 
     def removeObjectInstance(self, object_instance_handle: ObjectInstanceHandle, _user_tag: bytes, producing_federate: FederateHandle):
         """
@@ -144,24 +146,20 @@ class SimpleFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates removal tracking set and cleans associated name/class mappings.
         """
-        removed = getattr(self.my_data, 'my_removed_instances', None)
-        if removed is None:
-            removed = set()
-            setattr(self.my_data, 'my_removed_instances', removed)
-        removed.add(object_instance_handle)
+        data = self.my_data
+        data.my_removed_instances.add(object_instance_handle)
         # Cleanup name maps if present
-        handle_to_name = self.my_data.my_object_instance_handle_names.get(producing_federate)
-        if handle_to_name and object_instance_handle in handle_to_name:
-            name = handle_to_name.pop(object_instance_handle)
-            name_to_handles = self.my_data.my_object_instance_name_handles.get(producing_federate)
+        handle_to_name = data.my_object_instance_handle_names.get(producing_federate)
+        name = handle_to_name.pop(object_instance_handle, None) if handle_to_name else None
+        if name is not None:
+            name_to_handles = data.my_object_instance_name_handles.get(producing_federate)
             #remove from handle names
             if name_to_handles:
                 name_to_handles.pop(name, None)
         # Clean direct class map
-        if object_instance_handle in self.my_data.my_object_instance_classes:
-            self.my_data.my_object_instance_classes.pop(object_instance_handle, None)
+        data.my_object_instance_classes.pop(object_instance_handle, None)
 
-        log_incoming(f"Removed Object Instance: {object_instance_handle}, Producing Federate: {producing_federate}")
+        log_incoming("Removed Object Instance: %s, Producing Federate: %s", object_instance_handle, producing_federate)
 
     def receiveInteraction(self, interaction_class_handle : InteractionClassHandle, parameters: ParameterHandleValueMap, user_tag: bytes, transport_type : TransportationTypeHandle, producing_federate : FederateHandle) -> None:
         """
@@ -174,16 +172,17 @@ class SimpleFederateAmbassador(FederateAmbassador):
                 producing_federate (FederateHandle): Origin federate.
                 parameters (dict | protobuf wrapper): Provides ListFields() of parameter entries.
             Side Effects:
-                Populates nested my_interaction_parameter_values map with raw parameter bytes.
+                Populates my_interaction_parameter_values keyed by (federate, interaction class, parameter) with raw parameter bytes.
         """
-        log_incoming(f"receiveInteraction - interaction class handle: {interaction_class_handle}, user_tag: {user_tag}, transport_type: {transport_type}, producing_federate: {producing_federate}")
+        log_incoming("receiveInteraction - interaction class handle: %s, user_tag: %s, transport_type: %s, producing_federate: %s", interaction_class_handle, user_tag, transport_type, producing_federate)
         log_incoming("Parameters:")
         # Grabbing the first descriptor/field-descriptor pairs for ParameterHandleValueMap (We only expect one)
         handle_values = parameters.items()
+        parameter_values = self.my_data.my_interaction_parameter_values
         for handle, value in handle_values:
             # Process each attribute value 
-            log_incoming(f"   handle: {handle}, value: {value}")
-            self.my_data.my_interaction_parameter_values[producing_federate][interaction_class_handle][handle] = value
+            log_incoming("   handle: %s, value: %s", handle, value)
+            parameter_values[(producing_federate, interaction_class_handle, handle)] = value
 
     def reflectAttributeValues(self, object_instance_handle: ObjectInstanceHandle, attributes: AttributeHandleValueMap, user_tag: bytes, transport_type: TransportationTypeHandle, producing_federate: FederateHandle) -> None:
         """
@@ -198,13 +197,17 @@ class SimpleFederateAmbassador(FederateAmbassador):
             Side Effects:
                 Updates my_object_instance_attrs with handle -> raw value mapping.
         """
-        log_incoming(f"reflectAttributeValues - object instance handle: {object_instance_handle}, user_tag: {user_tag}, transport_type: {transport_type}, producing_federate: {producing_federate}")
+        data = self.my_data
+        log_incoming("reflectAttributeValues - object instance handle: %s, user_tag: %s, transport_type: %s, producing_federate: %s", object_instance_handle, user_tag, transport_type, producing_federate)
+        if object_instance_handle in data.my_removed_instances:
+            return
         log_incoming("Attributes:")
         # Grabbing the first descriptor/field-descriptor pairs for AttributeHandleValueMap (We only expect one)
         handle_values = attributes.items()
+        # my_object_instance_attrs is a defaultdict: the instance's map is created on first reflection
+        instance_attrs = data.my_object_instance_attrs[object_instance_handle]
         for handle, value in handle_values:
             # Process each attribute value
-            log_incoming(f"   handle: {handle}, value: {value}")
+            log_incoming("   handle: %s, value: %s", handle, value)
             attribute_handle : AttributeHandle = AttributeHandle(handle.data)
-            self.my_data.my_object_instance_attrs[object_instance_handle] = {}
-            self.my_data.my_object_instance_attrs[object_instance_handle][attribute_handle] = value
+            instance_attrs[attribute_handle] = value
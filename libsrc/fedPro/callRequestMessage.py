@@ -1,6 +1,5 @@
-import struct
 from libsrc.fedPro.fedProMessage import MsgType
-from libsrc.fedPro.fedProMessage import FedProMessage
+from libsrc.fedPro.fedProMessage import FedProMessage, HLA_HEADER_STRUCT, UINT32_STRUCT
 
 class CallRequestMessage(FedProMessage):
     """Class representing a callback request message in the Federate Protocol."""
@@ -12,8 +11,8 @@ class CallRequestMessage(FedProMessage):
                 request_data: Protobuf message (RTIambassador_pb2.*) supporting ListFields() and
                     SerializeToString(). First populated field determines request type.
             Outputs:
-                None (constructor). Side-effects: sets my_request_type, my_request_data, adjusts
-                my_msg_size and my_format to include payload length.
+                None (constructor). Side-effects: sets my_request_type, my_request_data, keeps the
+                serialized payload in my_payload, adjusts my_msg_size and my_format to include payload length.
             Exceptions:
                 Attribute errors if request_data lacks expected protobuf methods; no explicit handling.
         """
@@ -22,6 +21,7 @@ class CallRequestMessage(FedProMessage):
         self.my_request_type = request_data.ListFields()[0][0].number
         msg_buff = request_data.SerializeToString()
         self.my_request_data = request_data
+        self.my_payload = msg_buff
         if (msg_buff != 0):
             self.my_msg_size += len(msg_buff)
             self.my_format += f'{len(msg_buff)}s'
@@ -33,16 +33,14 @@ class CallRequestMessage(FedProMessage):
                 Pack header and serialized protobuf payload into a bytes object for transmission
                 or storage.
             Inputs:
-                None (uses internal state: my_format, header fields, my_request_data).
+                None (uses internal state: header fields, payload serialized at construction).
             Outputs:
                 bytes representing the full message.
             Exceptions:
-                struct.error if my_format is inconsistent; protobuf serialization errors possible.
+                struct.error if a header field is out of range.
         """
-        pbytes = struct.pack(self.my_format, self.my_msg_size, self.my_sequence_num,\
-        self.my_session_id, self.my_last_received_msg, int(self.my_msg_type),\
-            self.my_request_data.SerializeToString())
-        return pbytes
+        return HLA_HEADER_STRUCT.pack(self.my_msg_size, self.my_sequence_num,\
+        self.my_session_id, self.my_last_received_msg, int(self.my_msg_type)) + self.my_payload
 
     def from_bytes(self, buffer):
         """
@@ -57,8 +55,8 @@ class CallRequestMessage(FedProMessage):
             Exceptions:
                 struct.error if buffer slices are shorter than required length.
         """
-        byte_ins = struct.unpack('>IIQII', bytes(buffer[1][0:24]))
-        self.my_msg_size = struct.unpack(">I", buffer[0])[0]
+        byte_ins = HLA_HEADER_STRUCT.unpack_from(buffer[1])
+        self.my_msg_size = UINT32_STRUCT.unpack(buffer[0])[0]
         self.my_sequence_num = byte_ins[0]
         self.my_session_id = byte_ins[1]
         self.my_last_received_msg = byte_ins[2]
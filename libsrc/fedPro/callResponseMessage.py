@@ -1,9 +1,8 @@
 
 import os
 import sys
-import struct
 from libsrc.fedPro.fedProMessage import MsgType
-from libsrc.fedPro.fedProMessage import FedProMessage
+from libsrc.fedPro.fedProMessage import FedProMessage, HEADER_TAIL_STRUCT, UINT32_STRUCT
 # Set the top directory to be two levels higher than the current directory
 current_dir = os.path.dirname(os.path.abspath(__file__))
 top_dir = os.path.dirname(current_dir)
@@ -42,7 +41,7 @@ class CallResponseMessage(FedProMessage):
             self.my_last_received_msg = instance.my_last_received_msg
             self.my_hla_msg_type = (-1)
             if len(instance.my_payload) >= 4:
-                payload = struct.unpack(f'>I{len(instance.my_payload[4:])}s', instance.my_payload)
+                payload = (UINT32_STRUCT.unpack_from(instance.my_payload)[0], instance.my_payload[4:])
                 call_response = RTIambassador_pb2.CallResponse()
                 if payload[0] != 0:
                     call_response.ParseFromString(payload[1])  # type: ignore[attr-defined]
@@ -65,8 +64,8 @@ class CallResponseMessage(FedProMessage):
             Exceptions:
                 struct.error if buffer layout invalid; protobuf parsing errors uncaught.
         """
-        self.my_msg_size = struct.unpack(">I", buffer[0])[0]
-        byte_ins = struct.unpack('>IQII', bytes(buffer[1][0:20]))
+        self.my_msg_size = UINT32_STRUCT.unpack(buffer[0])[0]
+        byte_ins = HEADER_TAIL_STRUCT.unpack_from(buffer[1])
         self.my_sequence_num = byte_ins[0]
         self.my_session_id = byte_ins[1]
         self.my_last_received_msg = byte_ins[2]
@@ -75,7 +74,7 @@ class CallResponseMessage(FedProMessage):
         self.my_response_buf = ()
         if self.my_msg_size > 24:
             #I
-            payload = struct.unpack(f'>I{len(buffer[1][24:])}s', buffer[1][20:])
+            payload = (UINT32_STRUCT.unpack_from(buffer[1], 20)[0], buffer[1][24:])
             call_response = RTIambassador_pb2.CallResponse()
             if payload[0] != 0:
                 call_response.ParseFromString(payload[1])  # type: ignore[attr-defined]
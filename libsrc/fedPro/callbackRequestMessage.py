@@ -2,10 +2,9 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
-import struct
 from FedProProtobuf import FederateAmbassador_pb2
 from libsrc.fedPro.fedProMessage import MsgType
-from libsrc.fedPro.fedProMessage import FedProMessage
+from libsrc.fedPro.fedProMessage import FedProMessage, HEADER_TAIL_STRUCT, UINT32_STRUCT
 
 class CallbackRequestMessage(FedProMessage):
     """Class representing a callback request message received from RTI in the Federate Protocol."""
@@ -39,7 +38,7 @@ class CallbackRequestMessage(FedProMessage):
             self.my_last_received_msg = instance.my_last_received_msg
             self.my_hla_msg_type = (-1)
             if len(instance.my_payload) >= 4:
-                payload = struct.unpack(f'>{len(instance.my_payload)}s', instance.my_payload)
+                payload = (instance.my_payload,)
                 callback_request = FederateAmbassador_pb2.CallbackRequest()
                 if payload[0] != 0:
                     callback_request.ParseFromString(payload[0])
@@ -65,8 +64,8 @@ class CallbackRequestMessage(FedProMessage):
                 struct.error if buffer segments are shorter than expected.
                 Protobuf DecodeError if payload cannot be parsed (not caught explicitly).
         """
-        self.my_msg_size = struct.unpack(">I", buffer[0])[0]
-        byte_ins = struct.unpack('>IQII', bytes(buffer[1][0:20]))
+        self.my_msg_size = UINT32_STRUCT.unpack(buffer[0])[0]
+        byte_ins = HEADER_TAIL_STRUCT.unpack_from(buffer[1])
         self.my_sequence_num = byte_ins[0]
         self.my_session_id = byte_ins[1]
         self.my_last_received_msg = byte_ins[2]
@@ -75,7 +74,7 @@ class CallbackRequestMessage(FedProMessage):
         self.my_request_buf = ()
         if self.my_msg_size > 24:
             #I
-            payload = struct.unpack(f'>I{len(buffer[1][24:])}s', buffer[1][20:])
+            payload = (UINT32_STRUCT.unpack_from(buffer[1], 20)[0], buffer[1][24:])
             callback_request = FederateAmbassador_pb2.CallbackRequest()
             if payload[0] != 0:
                 callback_request.ParseFromString(payload[1])
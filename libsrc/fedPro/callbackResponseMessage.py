@@ -2,9 +2,9 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
-import struct
 from libsrc.fedPro.fedProMessage import MsgType
-from libsrc.fedPro.fedProMessage import FedProMessage
+from libsrc.fedPro.fedProMessage import FedProMessage, HLA_HEADER_STRUCT
+from libsrc.rtiUtil.logger import *
 from FedProProtobuf import FederateAmbassador_pb2
 
 class CallbackResponseMessage(FedProMessage):
@@ -47,10 +47,10 @@ class CallbackResponseMessage(FedProMessage):
         if succeeded:
             # Mark as success (protobuf field presence implied)  # type: ignore[attr-defined]
             self.my_response_type = 0  # callbackSucceeded field number
-            print("Creating callbackSucceeded response")
+            log_debug("Creating callbackSucceeded response")
         else:
             # For failure, we'd need ExceptionData, but for now keep it simple
-            print("Creating basic callback response (no failure handling yet)")
+            log_debug("Creating basic callback response (no failure handling yet)")
             self.my_response_type = 1  # callbackFailed field number  # type: ignore[attr-defined]
 
     def to_bytes(self):
@@ -59,7 +59,7 @@ class CallbackResponseMessage(FedProMessage):
                 Serialize the response message to a packed bytes structure including header and
                 serialized protobuf payload.
             Inputs:
-                None (uses instance fields: my_format, my_msg_size, sequence/session info, etc.).
+                None (uses instance fields: my_msg_size, sequence/session info, etc.).
             Outputs:
                 bytes representing the full wire format for transmission.
             Exceptions:
@@ -67,11 +67,8 @@ class CallbackResponseMessage(FedProMessage):
                 response payload invalid.
         """
         response_payload = self.my_response_data.SerializeToString()  # type: ignore[attr-defined]
-        pack_format = (self.my_format + f'{len(response_payload)}s')
-        pbytes = struct.pack(pack_format, self.my_msg_size, self.my_sequence_num,
-                            self.my_session_id, self.my_last_received_msg, int(self.my_msg_type),
-                            response_payload)
-        return pbytes
+        return HLA_HEADER_STRUCT.pack(self.my_msg_size, self.my_sequence_num,
+                            self.my_session_id, self.my_last_received_msg, int(self.my_msg_type)) + response_payload
 
     def __str__(self):
         """
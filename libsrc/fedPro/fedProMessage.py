@@ -1,6 +1,12 @@
 import struct
 from enum import Enum
 
+# Precompiled wire layouts (network byte order) shared by the message classes.
+# HLA call/callback header: size, sequence num, session id, last received, message type (24 bytes).
+UINT32_STRUCT = struct.Struct(">I")
+HEADER_TAIL_STRUCT = struct.Struct(">IQII")
+HLA_HEADER_STRUCT = struct.Struct(">IIQII")
+
 class MsgType(int, Enum):
     """Enumeration of the message types used in the Federate Protocol."""
     UNKNOWN = 0
@@ -112,8 +118,8 @@ class FedProMessage():
             Exceptions:
                 struct.error if buffer segments are too short; not caught here.
         """
-        self.my_msg_size = struct.unpack(">I", buffer[0])[0]
-        byte_ins = struct.unpack('>IQII', bytes((buffer[1])[0:20]))
+        self.my_msg_size = UINT32_STRUCT.unpack(buffer[0])[0]
+        byte_ins = HEADER_TAIL_STRUCT.unpack_from(buffer[1])
         self.my_sequence_num = byte_ins[0]
         self.my_session_id = byte_ins[1]
         self.my_last_received_msg = byte_ins[2]
@@ -1,6 +1,6 @@
 import struct
 from enum import Enum
-from libsrc.fedPro.fedProMessage import MsgType, FedProMessage
+from libsrc.fedPro.fedProMessage import MsgType, FedProMessage, UINT32_STRUCT
 
 class SessionStatus(Enum):
     """Enum representing the status of a session in the Federate Protocol."""
@@ -28,7 +28,7 @@ class NewSessionStatusMessage(FedProMessage):
             Exceptions:
                 struct.error if payload size < 4 when unpacking; not explicitly handled.
         """
-        if instance.my_msg_size is 0:
+        if instance.my_msg_size == 0:
             super().__init__(MsgType.CTRL_NEW_SESSION_STATUS, 28)
             self.my_status : SessionStatus = SessionStatus.INTERNAL_ERROR
             return
@@ -41,7 +41,7 @@ class NewSessionStatusMessage(FedProMessage):
         self.my_format = ">IIQQI"
         self.my_status : SessionStatus = SessionStatus.INTERNAL_ERROR
         if len(instance.my_payload) > 0:
-            self.my_status = SessionStatus(int(struct.unpack(">I", instance.my_payload)[0]))
+            self.my_status = SessionStatus(UINT32_STRUCT.unpack(instance.my_payload)[0])
 
     def to_bytes(self):
         """
@@ -72,7 +72,8 @@ class NewSessionStatusMessage(FedProMessage):
         """
         super().from_bytes(buffer)
 
-        self.my_status = SessionStatus(int(struct.unpack(">I", buffer[1][20:])[0]))
+        # Read the status in place at its header offset rather than slicing out a copy
+        self.my_status = SessionStatus(UINT32_STRUCT.unpack_from(buffer[1], 20)[0])
 
     def __str__(self):
         """
@@ -397,15 +397,17 @@ class FedProMsgHandler:
                     message = self.my_socket.get_message(max_time / 3) # 100ms timeoutself.my_socket.get_message(timeout)
 
                 if message.my_msg_type is not fedProMessage.MsgType.INVALID and message.my_msg_size >= 0:
-                    if (self.msg_types.get(message.my_msg_type) is None):
+                    # One lookup per message: (message class, optional handler)
+                    msg_entry = self.msg_types.get(message.my_msg_type)
+                    if msg_entry is None:
                         raise exceptions.FedProMessageError(f"Unexpected message type: {message.my_msg_type}")
 
                     # Cast the message to be the correct type
-                    message = self.msg_types[message.my_msg_type][0](message)
+                    message = msg_entry[0](message)
                     # Call the appropriate handler
                     self.my_last_received_message_number = message.my_sequence_num
-                    if (len(self.msg_types[message.my_msg_type]) > 1):
-                        got_message = self.msg_types[message.my_msg_type][1](message)
+                    if len(msg_entry) > 1:
+                        got_message = msg_entry[1](message)
                     self.my_sequence_num += 1
                     message_count += 1
 
@@ -4,7 +4,7 @@
 """
 from typing import Any
 from libsrc.rtiUtil.logger import *
-from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador
+from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador, is_callback_overridden
 from HLA1516_2025.RTI.handles import AttributeHandle, ParameterHandle
 from HLA1516_2025.RTI.typedefs import AttributeHandleValueMap, ParameterHandleValueMap
 from HLA1516_2025.RTI.handles import FederateHandle, InteractionClassHandle, ObjectClassHandle, ObjectInstanceHandle, TransportationTypeHandle
@@ -52,10 +52,16 @@ class FederateAmbassadorFedPro():
         self.my_FedPro_Message_Handler.add_callback_request_callback(cb.FEDERATERESIGNED_FIELD_NUMBER, self.federate_resigned)
         self.my_FedPro_Message_Handler.add_callback_request_callback(cb.OBJECTINSTANCENAMERESERVATIONFAILED_FIELD_NUMBER, self.object_name_reservation_failed)
         self.my_FedPro_Message_Handler.add_callback_request_callback(cb.OBJECTINSTANCENAMERESERVATIONSUCCEEDED_FIELD_NUMBER, self.object_instance_name_reservation_succeeded)
-        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.DISCOVEROBJECTINSTANCE_FIELD_NUMBER, self.discover_object_instance)
-        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.REMOVEOBJECTINSTANCE_FIELD_NUMBER, self.remove_object_instance)
-        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.REFLECTATTRIBUTEVALUES_FIELD_NUMBER, self.reflect_attribute_values)
-        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.RECEIVEINTERACTION_FIELD_NUMBER, self.receive_interaction)
+        # High-rate object/interaction callbacks are only decoded if the ambassador overrides the no-op default
+        fa = self.my_Federate_Ambassador
+        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.DISCOVEROBJECTINSTANCE_FIELD_NUMBER,
+            self.discover_object_instance if is_callback_overridden(fa, "discoverObjectInstance") else self.acknowledge_callback)
+        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.REMOVEOBJECTINSTANCE_FIELD_NUMBER,
+            self.remove_object_instance if is_callback_overridden(fa, "removeObjectInstance") else self.acknowledge_callback)
+        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.REFLECTATTRIBUTEVALUES_FIELD_NUMBER,
+            self.reflect_attribute_values if is_callback_overridden(fa, "reflectAttributeValues") else self.acknowledge_callback)
+        self.my_FedPro_Message_Handler.add_callback_request_callback(cb.RECEIVEINTERACTION_FIELD_NUMBER,
+            self.receive_interaction if is_callback_overridden(fa, "receiveInteraction") else self.acknowledge_callback)
         self.my_FedPro_Message_Handler.add_callback_request_callback(-99, self.unknown_callback)
 
     def connection_lost(self, message, sequence_number: int):
@@ -295,12 +301,12 @@ class FederateAmbassadorFedPro():
     def receive_interaction(self, message, sequence_number: int):
         """
             Description:
-                Process an interaction (parameter set) and delegate to base handler after preparing caches.
+                Process an interaction (parameter set) and delegate to base handler.
             Args:
                 message (Any): Callback with receiveInteraction sub-message.
                 sequence_number (int): Correlation id.
             Outputs:
-                Populates nested parameter value cache structures then invokes self.receiveInteraction(...).
+                Builds the parameter handle-value map then invokes self.receiveInteraction(...).
             Exceptions:
                 Broad catch logs and replies failure.
         """
@@ -310,12 +316,12 @@ class FederateAmbassadorFedPro():
             _user_tag = reflect_parameter_values.userSuppliedTag
             transport_type : TransportationTypeHandle = reflect_parameter_values.transportationType.data
             producing_federate : FederateHandle = FederateHandle(reflect_parameter_values.producingFederate.data)
-            self.my_Federate_Ambassador.my_data.my_interaction_parameter_values[producing_federate] = {}
-            self.my_Federate_Ambassador.my_data.my_interaction_parameter_values[producing_federate][interaction_class_handle] = {}
-            parameter_values = reflect_parameter_values.parameterValues
-            phvpm : ParameterHandleValueMap = {}
-            for param in parameter_values.ListFields()[0][1]:
-                phvpm[ParameterHandle(param.parameterHandle.data)] = param.value
+            # Iterate the repeated field directly; ListFields() would build a descriptor/value list first
+            # (and fail on an empty map)
+            phvpm : ParameterHandleValueMap = {
+                ParameterHandle(param.parameterHandle.data): param.value
+                for param in reflect_parameter_values.parameterValues.parameterHandleValue
+            }
             self.my_Federate_Ambassador.receiveInteraction(interaction_class_handle, phvpm, _user_tag, transport_type, producing_federate)
 
             self.my_FedPro_Message_Handler.send_callback_response(sequence_number, True)
@@ -341,10 +347,10 @@ class FederateAmbassadorFedPro():
             user_tag = reflect_attribute_values.userSuppliedTag
             transport_type : TransportationTypeHandle = reflect_attribute_values.transportationType.data
             producing_federate : FederateHandle = FederateHandle(reflect_attribute_values.producingFederate.data)
-            attribute_values = reflect_attribute_values.attributeValues
-            ahvpm : AttributeHandleValueMap = {}
-            for attr in attribute_values.ListFields()[0][1]:
-                ahvpm[AttributeHandle(attr.attributeHandle.data)] = attr.value
+            ahvpm : AttributeHandleValueMap = {
+                AttributeHandle(attr.attributeHandle.data): attr.value
+                for attr in reflect_attribute_values.attributeValues.attributeHandleValue
+            }
             self.my_Federate_Ambassador.reflectAttributeValues(object_instance_handle, ahvpm, user_tag, transport_type, producing_federate)
 
             self.my_FedPro_Message_Handler.send_callback_response(sequence_number, True)
@@ -352,6 +358,20 @@ class FederateAmbassadorFedPro():
             log_error(f"Error in reflect_attribute_values: {e}")
             self.my_FedPro_Message_Handler.send_callback_response(sequence_number, False)
 
+    def acknowledge_callback(self, _message, sequence_number: int):
+        """
+            Description:
+                Stand-in handler for callbacks the ambassador does not override; replies success without decoding.
+            Args:
+                _message (Any): Callback envelope (unused).
+                sequence_number (int): Correlation id.
+            Outputs:
+                Sends success callback response.
+            Exceptions:
+                None.
+        """
+        self.my_FedPro_Message_Handler.send_callback_response(sequence_number, True)
+
     def unknown_callback(self, message, sequence_number: int):
         """
             Description:
@@ -2,6 +2,7 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
+import sys
 from libsrc.rtiUtil.logger import *
 from HLA1516_2025.RTI.enums import Enums
 import HLA1516_2025.RTI.exceptions as RtiException
@@ -11,11 +12,25 @@ from HLA1516_2025.RTI.rtiConfiguration import RtiConfiguration
 from libsrc.fedProWrapper.fedProMessageHandler import FedProMsgHandler
 from libsrc.fedPro.callRequestMessage import CallRequestMessage
 from HLA1516_2025.RTI.federateAmbassador import FederateAmbassador
-from FedProProtobuf import RTIambassador_pb2, datatypes_pb2
-from HLA1516_2025.RTI.typedefs import AttributeHandleSet, ConfigurationResult
+from FedProProtobuf import RTIambassador_pb2
+from HLA1516_2025.RTI.typedefs import AttributeHandleSet, AttributeValueBatch, ConfigurationResult, UserSuppliedTag, make_attr_set
 from libsrc.fedProWrapper.fedProMessageHandler import the_call_response_ref
 from HLA1516_2025.RTI.handles import AttributeHandle, FederateHandle, ObjectClassHandle,  ObjectInstanceHandle, InteractionClassHandle, ParameterHandle
 
+# Resign action keyword -> FedPro protobuf ResignAction value (differs from Enums.ResignAction numbering)
+_RESIGN_ACTIONS = {
+    "NO_ACTION": 0,
+    "UNCONDITIONALLY_DIVEST_ATTRIBUTES": 1,
+    "DELETE_OBJECTS": 2,
+    "CANCEL_PENDING_OWNERSHIP_ACQUISITIONS": 3,
+    "DELETE_OBJECTS_THEN_DIVEST": 4,
+    "CANCEL_THEN_DELETE_THEN_DIVEST": 5
+}
+
+def _tag_bytes(user_supplied_tag: UserSuppliedTag) -> bytes:
+    # protobuf bytes fields take bytes; only other buffer types need converting
+    return user_supplied_tag if type(user_supplied_tag) is bytes else bytes(user_supplied_tag)
+
 class Configuration:
     def __init__(self):
         self.federate_name : str = ""
@@ -56,6 +71,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         self.my_interaction_name_handles : dict[str, InteractionClassHandle] = {}
         self.my_interaction_handle_names : dict[InteractionClassHandle, str] = {}
         self.my_parameter_name_handles : dict[InteractionClassHandle, dict[str, ParameterHandle]] = {}
+        self.my_published_attrs : dict[ObjectClassHandle, AttributeHandleSet] = {}
 #===============================================================================================================================
 
 #=====================================================RTI Services===============================================================
@@ -87,9 +103,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         call_request = RTIambassador_pb2.CallRequest()
         conn_request = call_request.connectWithConfigurationRequest
         rti_configuration = conn_request.rtiConfiguration
-        rti_configuration.rtiAddress = configuration.rti_address[0]
-        rti_configuration.rtiAddress += ":"
-        rti_configuration.rtiAddress += str(configuration.rti_address[1])
+        rti_configuration.rtiAddress = f"{configuration.host}:{configuration.port}"
         rti_configuration.configurationName = configuration.configuration_name
         rti_configuration.additionalSettings = configuration.additional_settings
         # Set FedPro payload in call request message
@@ -97,12 +111,10 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         self.rti_connection = self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.CONNECTWITHCONFIGURATIONRESPONSE_FIELD_NUMBER, 30)
         if self.rti_connection:
             self.my_is_connection_ok = True
-            conn_result = ConfigurationResult()
-            conn_result.addressUsed = self.my_msg_handler.my_fedPro_response.my_response_buf.connectWithCredentialsResponse.configurationResult.addressUsed
-            conn_result.configurationUsed = self.my_msg_handler.my_fedPro_response.my_response_buf.connectWithCredentialsResponse.configurationResult.configurationUsed
-            conn_result.additionalSettingsResultCode = self.my_msg_handler.my_fedPro_response.my_response_buf.connectWithCredentialsResponse.configurationResult.additionalSettingsResultCode
-            conn_result.message = self.my_msg_handler.my_fedPro_response.my_response_buf.connectWithCredentialsResponse.configurationResult.message
-            return conn_result
+            result = self.my_msg_handler.my_fedPro_response.my_response_buf.connectWithConfigurationResponse.configurationResult
+            # Build through the constructor: ConfigurationResult is slotted, so only its declared fields exist
+            return ConfigurationResult(result.configurationUsed, result.addressUsed,
+                                       Enums.AdditionalSettingsResultCode(result.additionalSettingsResultCode), result.message)
         else:
             log_error("ERROR: Failed to get connection response from RTI")
             self.my_is_connection_ok = False
@@ -132,15 +144,18 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         if self.my_msg_handler.federate_ambassador_handler is None:
             raise RtiException.RTIinternalError("RTI Ambassador connection is not initialized")
         
+        # Names and module URLs recur across create/join calls; intern them once at the boundary
+        federation_name = sys.intern(federation_name)
+        fom_modules = [sys.intern(module) for module in fom_modules]
         log_outgoing(f"DtRtiAmbassadorFedPro::create_fed_ex\nfederationName: {federation_name}\nfomModules: ")
         log_outgoing(fom_modules)
 
         call_request = RTIambassador_pb2.CallRequest()
         create_request = call_request.createFederationExecutionWithModulesRequest
         create_request.federationName = federation_name
+        add_module = create_request.fomModules.fomModule.add
         for module in fom_modules:
-            fom = create_request.fomModules.fomModule.add()
-            fom.url = module
+            add_module(url=module)
 
         call_request_msg = CallRequestMessage(call_request)
         if self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.CREATEFEDERATIONEXECUTIONWITHMODULESRESPONSE_FIELD_NUMBER, 10):
@@ -177,6 +192,10 @@ class RtiAmbassadorFedPro(RtiAmbassador):
                 Raises RTIinternalError on failure or missing/invalid response.
         """
 
+        federate_name = sys.intern(federate_name)
+        federate_type = sys.intern(federate_type)
+        federation_name = sys.intern(federation_name)
+        fom_modules = [sys.intern(module) for module in fom_modules]
         log_outgoing("\nDtRtiAmbassadorFedPro::join_fed_ex\nfederateName: " + federate_name\
             + "\nfederateType: " + federate_type + "\nfederationName: " + federation_name + "\n")
         
@@ -185,9 +204,9 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         join_request.federateName = federate_name
         join_request.federateType = federate_type
         join_request.federationName = federation_name
+        add_module = join_request.additionalFomModules.fomModule.add
         for module in fom_modules:
-            fom = join_request.additionalFomModules.fomModule.add()
-            fom.url = module
+            add_module(url=module)
 
         call_request_msg = CallRequestMessage(call_request)
         if self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.JOINFEDERATIONEXECUTIONWITHNAMEANDMODULESRESPONSE_FIELD_NUMBER, 10):
@@ -246,12 +265,12 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             Exceptions:
                 Raises RTIinternalError when remote request fails or no valid response returned.
         """
-        log_outgoing("\nDtRtiAmbassadorFedPro::get_object_class_handle\nobjectClassName: " + object_class_name + "\n")
-
+        # Cache hits return before any logging so repeated resolutions cost a single dict probe
         object_class_handle = self.my_obj_name_handles.get(object_class_name)
         if object_class_handle is not None:
-            log_info(f"Found cached object handle {object_class_handle}.")
             return object_class_handle
+
+        log_outgoing("\nDtRtiAmbassadorFedPro::get_object_class_handle\nobjectClassName: " + object_class_name + "\n")
         
         call_request = RTIambassador_pb2.CallRequest()
         get_object_class_handle_request = call_request.getObjectClassHandleRequest
@@ -262,8 +281,11 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             object_class_handle = ObjectClassHandle(self.my_msg_handler.my_fedPro_response.my_response_buf.getObjectClassHandleResponse.result.data)
             self.my_obj_name_handles[object_class_name] = object_class_handle
             self.my_obj_handle_names[self.my_obj_name_handles[object_class_name]] = object_class_name
-            self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data.my_attr_handle_names[object_class_handle] = {}
-            self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data.my_attr_name_handles[object_class_handle] = {}
+            fed_data = self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data
+            fed_data.my_attr_handle_names[object_class_handle] = {}
+            fed_data.my_attr_name_handles[object_class_handle] = {}
+            # The reflection decode table is derived from the attribute maps just reset
+            fed_data.my_attr_dispatch.pop(object_class_handle, None)
             log_incoming("+++++++++++")
             log_incoming("Object class handle retreived successfully")
             log_incoming(f"{object_class_name}:{self.my_obj_name_handles[object_class_name]}")
@@ -293,14 +315,14 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             Exceptions:
                 Raises RTIinternalError when remote resolution fails or unexpected/no response.
         """
-        log_outgoing("\nDtRtiAmbassadorFedPro::get_attribute_handle\nattrName: " + attr_name + "\n")
-
-        attr_handle_map = self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data.my_attr_name_handles.get(class_handle)
+        fed_data = self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data
+        attr_handle_map = fed_data.my_attr_name_handles.get(class_handle)
         if attr_handle_map is not None:
             attr_handle = attr_handle_map.get(attr_name)
             if attr_handle is not None:
-                log_info(f"Found cached object handle {attr_handle}.")
                 return attr_handle
+
+        log_outgoing("\nDtRtiAmbassadorFedPro::get_attribute_handle\nattrName: " + attr_name + "\n")
         call_request = RTIambassador_pb2.CallRequest()
         get_attribute_handle_request = call_request.getAttributeHandleRequest
         get_attribute_handle_request.objectClass.data = class_handle.data
@@ -313,8 +335,10 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             log_incoming(f"{self.my_msg_handler.my_fedPro_response.my_response_buf.getAttributeHandleResponse.result.data}")
             log_incoming("Object class handle retreived successfully")
             attribute_handle = AttributeHandle(self.my_msg_handler.my_fedPro_response.my_response_buf.getAttributeHandleResponse.result.data)
-            self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data.my_attr_handle_names[class_handle][attribute_handle] = attr_name
-            self.my_msg_handler.federate_ambassador_handler.my_Federate_Ambassador.my_data.my_attr_name_handles[class_handle][attr_name] = attribute_handle
+            # Interned so the cached names compare by identity against the literals callers use as keys
+            attr_name = sys.intern(attr_name)
+            fed_data.my_attr_handle_names.setdefault(class_handle, {})[attribute_handle] = attr_name
+            fed_data.my_attr_name_handles.setdefault(class_handle, {})[attr_name] = attribute_handle
             return attribute_handle
         else:
             log_warning(self.my_msg_handler.my_fedPro_response)
@@ -324,7 +348,23 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             else:
                 log_error("ERROR: Failed to create federation execution, Unexpected or No responses received")
             raise RtiException.RTIinternalError("Failed to get attribute handle")
-        
+
+    def get_attribute_handles_batch(self, class_handle: ObjectClassHandle, attr_names: list[str])-> dict[str, AttributeHandle]:
+        """
+            Description:
+                Resolve several attribute handles of one object class in a single call. Cached names are served
+                without a round trip; the Federate Protocol has no multi-name lookup, so each uncached name is
+                one getAttributeHandle request.
+            Inputs:
+                self: rtiAmbassadorFedPro instance.
+                class_handle (ObjectClassHandle): Target object class handle.
+                attr_names (list[str]): Attribute names to resolve.
+            Outputs:
+                dict[str, AttributeHandle] mapping each requested name to its handle.
+            Exceptions:
+                Raises RTIinternalError when any remote resolution fails.
+        """
+        return {attr_name: self.get_attribute_handle(class_handle, attr_name) for attr_name in attr_names}
 
     def get_interaction_class_handle(self, interaction_name: str)-> InteractionClassHandle:
         """
@@ -338,12 +378,11 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             Exceptions:
                 Raises RTIinternalError on failure or missing response.
         """
-        log_outgoing("\nDtRtiAmbassadorFedPro::get_interaction_class_handle\ninteractionClassName: " + interaction_name + "\n")
-
         interaction_class_handle = self.my_interaction_name_handles.get(interaction_name)
         if interaction_class_handle is not None:
-            log_info(f"Found cached interaction handle {interaction_class_handle}.")
             return interaction_class_handle
+
+        log_outgoing("\nDtRtiAmbassadorFedPro::get_interaction_class_handle\ninteractionClassName: " + interaction_name + "\n")
         
         call_request = RTIambassador_pb2.CallRequest()
         get_interaction_class_handle_request = call_request.getInteractionClassHandleRequest
@@ -381,15 +420,14 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             Exceptions:
                 Raises RTIinternalError on remote failure or absent response.
         """
-        log_outgoing("\nDtRtiAmbassadorFedPro::get_parameter_handle\nparamName: " + param_name + "\n")
-
         param_handle_map = self.my_parameter_name_handles.get(interaction_handle)
         if param_handle_map is not None:
             param_handle = param_handle_map.get(param_name)
             if param_handle is not None:
-                log_info(f"Found cached parameter handle {param_handle}.")
                 return param_handle
 
+        log_outgoing("\nDtRtiAmbassadorFedPro::get_parameter_handle\nparamName: " + param_name + "\n")
+
         call_request = RTIambassador_pb2.CallRequest()
         get_parameter_handle_request = call_request.getParameterHandleRequest
         get_parameter_handle_request.interactionClass.data = interaction_handle.data
@@ -398,7 +436,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         call_request_msg = CallRequestMessage(call_request)
         
         if self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.GETPARAMETERHANDLERESPONSE_FIELD_NUMBER, 6):
-            self.my_parameter_name_handles[interaction_handle][param_name] = ParameterHandle(self.my_msg_handler.my_fedPro_response.my_response_buf.getParameterHandleResponse.result.data)
+            self.my_parameter_name_handles.setdefault(interaction_handle, {})[param_name] = ParameterHandle(self.my_msg_handler.my_fedPro_response.my_response_buf.getParameterHandleResponse.result.data)
             log_incoming(f"{param_name}:{self.my_parameter_name_handles[interaction_handle][param_name]}")
             log_incoming("Parameter handle retreived successfully")
             return self.my_parameter_name_handles[interaction_handle][param_name]
@@ -460,9 +498,10 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             Inputs:
                 self: rtiAmbassadorFedPro instance.
                 class_handle (ObjectClassHandle): Object class to publish attributes for.
-                attr_set (dict[str, AttributeHandle]): Mapping of attribute names to handles.
+                attr_set (AttributeHandleSet): Attribute handles to publish (a mutable set is frozen on entry).
             Outputs:
-                True on early return when attr_set empty; otherwise None (logs success) or raises on failure.
+                False on early return when attr_set empty; otherwise None (logs success) or raises on failure.
+                Re-publishing the set currently published for the class is skipped.
             Exceptions:
                 Raises RTIinternalError on publish failure or no response.
         """
@@ -474,18 +513,24 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         if not attr_set:
             log_warning("WARNING: Attempting to publish empty attribute set!")
             return False
+        attr_set = make_attr_set(attr_set)
+        if self.my_published_attrs.get(class_handle) == attr_set:
+            log_incoming("Object class attributes already published")
+            return
         
         call_request = RTIambassador_pb2.CallRequest()
         pub_attr_request = call_request.publishObjectClassAttributesRequest
 
         pub_attr_request.objectClass.data = class_handle.data
-        for attr_handle in attr_set:
+        # Canonical order: equal sets always encode to identical requests
+        for attr_handle in sorted(attr_set):
             temp_req = pub_attr_request.attributes.attributeHandle.add()
             temp_req.data = attr_handle
             
         call_request_msg = CallRequestMessage(call_request)
         
         if self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.PUBLISHOBJECTCLASSATTRIBUTESRESPONSE_FIELD_NUMBER, 8):
+            self.my_published_attrs[class_handle] = attr_set
             log_incoming("Object class attributes published successfully")
         else:
             log_warning(self.my_msg_handler.my_fedPro_response)
@@ -611,7 +656,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         
         call_request = RTIambassador_pb2.CallRequest()
 
-        if object_instance_name is not "":
+        if object_instance_name != "":
             register_request = call_request.registerObjectInstanceWithNameRequest
             # Debug: Check the structure before setting values
             register_request.objectClass.data = object_class_handle.data
@@ -735,16 +780,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             resign_request = call_request.resignFederationExecutionRequest
             
             # Map resign action string to enum value
-            resign_actions = {
-                "NO_ACTION": 0,
-                "UNCONDITIONALLY_DIVEST_ATTRIBUTES": 1,
-                "DELETE_OBJECTS": 2,
-                "CANCEL_PENDING_OWNERSHIP_ACQUISITIONS": 3,
-                "DELETE_OBJECTS_THEN_DIVEST": 4,
-                "CANCEL_THEN_DELETE_THEN_DIVEST": 5
-            }
-            
-            resign_request.resignAction = resign_actions.get(resign_action, 0)
+            resign_request.resignAction = _RESIGN_ACTIONS.get(resign_action, 0)
             
             call_request_msg = CallRequestMessage(call_request)
             resign_response = self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.RESIGNFEDERATIONEXECUTIONRESPONSE_FIELD_NUMBER, 3)
@@ -754,6 +790,8 @@ class RtiAmbassadorFedPro(RtiAmbassador):
                 return False
                 
             log_incoming("Resigned from federation execution successfully.")
+            # Handles are scoped to the federation execution; do not serve them from cache after resigning
+            self.invalidate_handles()
             return True
             
         except Exception as e:
@@ -762,6 +800,32 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             traceback.print_exc()
             raise e
 
+    def invalidate_handles(self) -> None:
+        """
+            Description:
+                Drop all cached name <-> handle mappings (object classes, attributes, interactions, parameters),
+                the reflection decode tables derived from them, and the record of published attribute sets.
+            Inputs:
+                self: rtiAmbassadorFedPro instance.
+            Outputs:
+                None; subsequent get_*_handle calls query the RTI again.
+            Exceptions:
+                None.
+        """
+        self.my_obj_name_handles.clear()
+        self.my_obj_handle_names.clear()
+        self.my_interaction_name_handles.clear()
+        self.my_interaction_handle_names.clear()
+        self.my_parameter_name_handles.clear()
+        self.my_published_attrs.clear()
+        # Handler only exists once a session has been initialized
+        fed_ambassador_handler = getattr(self.my_msg_handler, "federate_ambassador_handler", None)
+        if fed_ambassador_handler is not None:
+            fed_data = fed_ambassador_handler.my_Federate_Ambassador.my_data
+            fed_data.my_attr_name_handles.clear()
+            fed_data.my_attr_handle_names.clear()
+            fed_data.my_attr_dispatch.clear()
+
     def unpublish_object_class(self, class_handle: ObjectClassHandle)-> bool:
         """
             Description:
@@ -791,6 +855,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
                 log_error("ERROR: Received None response for unpublish object class")
                 return False
                 
+            self.my_published_attrs.pop(class_handle, None)
             log_incoming("Object class unpublished successfully.")
             return True
             
@@ -913,7 +978,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             traceback.print_exc()
             return False
 
-    def send_interaction(self, interaction_class_handle: InteractionClassHandle, parameter_values: dict[ParameterHandle, bytes], user_supplied_tag: bytes = b"")-> bool:
+    def send_interaction(self, interaction_class_handle: InteractionClassHandle, parameter_values: dict[ParameterHandle, bytes], user_supplied_tag: UserSuppliedTag = b"")-> bool:
         """
             Description:
                 Send an interaction with parameter values and optional user-supplied tag.
@@ -921,7 +986,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
                 self: rtiAmbassadorFedPro instance.
                 interaction_class_handle (InteractionClassHandle): Interaction class to send.
                 parameter_values (dict[ParameterHandle, bytes]): Mapping of parameter handles to raw values.
-                user_supplied_tag (bytes, optional): Optional annotation payload.
+                user_supplied_tag (UserSuppliedTag, optional): Optional annotation payload (bytes, bytearray or memoryview).
             Outputs:
                 True on success; False on failure or None response.
             Exceptions:
@@ -939,14 +1004,14 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             send_request = call_request.sendInteractionRequest
             send_request.interactionClass.data = interaction_class_handle.data
             if user_supplied_tag:
-                send_request.userSuppliedTag = user_supplied_tag
+                send_request.userSuppliedTag = _tag_bytes(user_supplied_tag)
 
             
-            # Add parameter handle-value pairs
+            # Add parameter handle-value pairs; handles are bytes, so assign them directly
+            add_parameter = send_request.parameterValues.parameterHandleValue.add
             for param_handle, param_value in parameter_values.items():
-                handle_value = send_request.parameterValues.parameterHandleValue.add()
-                
-                handle_value.parameterHandle.data = param_handle.data
+                handle_value = add_parameter()
+                handle_value.parameterHandle.data = param_handle
                 handle_value.value = param_value
             
             call_request_msg = CallRequestMessage(call_request)
@@ -965,14 +1030,14 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             traceback.print_exc()
             return False
 
-    def delete_object_instance(self, object_instance_handle: ObjectInstanceHandle, user_supplied_tag: bytes = b"")-> bool:
+    def delete_object_instance(self, object_instance_handle: ObjectInstanceHandle, user_supplied_tag: UserSuppliedTag = b"")-> bool:
         """
             Description:
                 Delete a registered object instance, optionally attaching a user-supplied tag.
             Inputs:
                 self: rtiAmbassadorFedPro instance.
                 object_instance_handle (ObjectInstanceHandle): Handle identifying instance to delete.
-                user_supplied_tag (bytes, default b""): Optional tag payload.
+                user_supplied_tag (UserSuppliedTag, default b""): Optional tag payload (bytes, bytearray or memoryview).
             Outputs:
                 True on success; False on None response or exception.
             Exceptions:
@@ -990,7 +1055,7 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             
             delete_request.objectInstance.data = object_instance_handle.data
             if user_supplied_tag:
-                delete_request.userSuppliedTag = user_supplied_tag
+                delete_request.userSuppliedTag = _tag_bytes(user_supplied_tag)
             
             call_request_msg = CallRequestMessage(call_request)
             delete_response = self.my_msg_handler.send_and_wait(call_request_msg, the_call_response_ref.DELETEOBJECTINSTANCERESPONSE_FIELD_NUMBER, 3)
@@ -1008,29 +1073,26 @@ class RtiAmbassadorFedPro(RtiAmbassador):
             traceback.print_exc()
             return False
 
-    def update_attribute_values(self, object_instance_handle: ObjectInstanceHandle, attribute_values: dict[AttributeHandle, bytes], user_supplied_tag: bytes=b""):
+    def update_attribute_values(self, object_instance_handle: ObjectInstanceHandle, attribute_values: dict[AttributeHandle, bytes] | AttributeValueBatch, user_supplied_tag: UserSuppliedTag=b""):
         """
             Description:
                 Update a set of attributes for a given object instance; sends update attribute values request.
             Inputs:
                 self: rtiAmbassadorFedPro instance.
                 object_instance_handle (ObjectInstanceHandle): Target instance handle.
-                attribute_values (dict[AttributeHandle, bytes]): Attribute handle to new raw value mapping.
-                user_supplied_tag (bytes, optional): Tag to attach; may be empty.
+                attribute_values (dict[AttributeHandle, bytes] | AttributeValueBatch): Attribute handle to new raw value mapping,
+                    or a prebuilt batch of parallel handle/value sequences.
+                user_supplied_tag (UserSuppliedTag, optional): Tag to attach (bytes, bytearray or memoryview); may be empty.
             Outputs:
                 None; logs success. Raises on failure.
             Exceptions:
                 Raises RTIinternalError for empty attribute set or failed update (exception or no response).
         """
-        log_outgoing(f"\nDtRtiAmbassadorFedPro::update_attribute_values")
-        log_outgoing(f"objectInstanceHandle: {object_instance_handle}")
-        log_outgoing(f"attributeValues count: {len(attribute_values)}")
-        if user_supplied_tag is not None:
-            log_outgoing(f"userSuppliedTag size: {len(user_supplied_tag)}")
-        log_outgoing("Attribute Values:")
-        for attr_handle, attr_value in attribute_values.items():
-            log_outgoing(f"  Attribute Handle: {attr_handle}, Value: {attr_value}")
-        log_outgoing(attribute_values)
+        log_outgoing("\nDtRtiAmbassadorFedPro::update_attribute_values objectInstanceHandle: %s, attributeValues count: %d",
+                     object_instance_handle, len(attribute_values))
+        if debug_enabled():
+            for attr_handle, attr_value in attribute_values.items():
+                log_debug("  Attribute Handle: %s, Value: %s", attr_handle, attr_value)
         
         if not attribute_values:
             log_warning("WARNING: No attribute values to update")
@@ -1039,20 +1101,22 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         call_request = RTIambassador_pb2.CallRequest()
         update_request = call_request.updateAttributeValuesRequest
         
-        # Set the object instance handle - handle both bytes and ObjectInstanceHandle objects
-        an_object_instance_handle = datatypes_pb2.ObjectInstanceHandle()
-        update_request.objectInstance.data = object_instance_handle.data
+        # Set the object instance handle
+        update_request.objectInstance.data = object_instance_handle
         
         # Set the user supplied tag
-        if user_supplied_tag is not None and user_supplied_tag:
-            update_request.userSuppliedTag = user_supplied_tag
+        if user_supplied_tag:
+            update_request.userSuppliedTag = _tag_bytes(user_supplied_tag)
         
-        # Add attribute handle-value pairs
-        for attr_handle, attr_value in attribute_values.items():
-            handle_value = update_request.attributeValues.attributeHandleValue.add()
-            
-            an_attribute_handle = datatypes_pb2.AttributeHandle()
-            handle_value.attributeHandle.data = attr_handle.data
+        # Add attribute handle-value pairs; handles are bytes, so assign them directly
+        add_attribute = update_request.attributeValues.attributeHandleValue.add
+        if isinstance(attribute_values, AttributeValueBatch):
+            pairs = zip(attribute_values.handles, attribute_values.values)
+        else:
+            pairs = attribute_values.items()
+        for attr_handle, attr_value in pairs:
+            handle_value = add_attribute()
+            handle_value.attributeHandle.data = attr_handle
             handle_value.value = attr_value
         # Send the request and wait for response
         call_request_msg = CallRequestMessage(call_request)
@@ -1068,6 +1132,33 @@ class RtiAmbassadorFedPro(RtiAmbassador):
         else:
             log_incoming("Attribute values updated successfully.")
 
+    def update_attribute_values_batch(self, updates: list[tuple[ObjectInstanceHandle, dict[AttributeHandle, bytes] | AttributeValueBatch, UserSuppliedTag]]) -> list[bool]:
+        """
+            Description:
+                Send attribute updates for several object instances in one call, e.g. every owned object once per tick.
+                The FedPro session matches one outstanding call response at a time, so each entry is still its own
+                UpdateAttributeValues request; a failed entry is logged and does not stop the rest.
+            Inputs:
+                self: rtiAmbassadorFedPro instance.
+                updates (list[tuple]): (object instance handle, attribute values, user supplied tag) per instance.
+            Outputs:
+                list[bool] parallel to updates: True where the update was acknowledged.
+            Exceptions:
+                Raises RTIinternalError if not connected; per-entry failures are reported in the result instead.
+        """
+        if not self.my_is_connection_ok:
+            raise RtiException.RTIinternalError("RTI Ambassador is not connected")
+
+        results : list[bool] = []
+        for object_instance_handle, attribute_values, user_supplied_tag in updates:
+            try:
+                self.update_attribute_values(object_instance_handle, attribute_values, user_supplied_tag)
+                results.append(True)
+            except RtiException.RTIinternalError as e:
+                log_error(f"ERROR: Batched update failed for {object_instance_handle}: {e}")
+                results.append(False)
+        return results
+
     def evoke_callback(self, max_time: float = 3.0):
         """
             Description:
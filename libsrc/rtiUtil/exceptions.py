@@ -2,15 +2,26 @@
     Python Federate Protocol © 2025 by MAK Technologies is licensed under CC BY-ND 4.0.
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
+import warnings
 
-class BaseException(Exception):
-    def __init__(self, message):
-        super().__init__(message)
-        self._msg = message
+# The deprecated BaseException alias is deliberately absent, so star-imports never shadow the builtin
+__all__ = ["HLAException", "FedProSocketError", "FedProMessageError"]
+
+class HLAException(Exception):
+    # Message is kept in Exception.args; no separate per-instance attribute
     def what(self):
-        return self._msg
+        return self.args[0] if self.args else ""
 
-class FedProSocketError(BaseException):
+class FedProSocketError(HLAException):
+    pass
+class FedProMessageError(HLAException):
     pass
-class FedProMessageError(BaseException):
-    pass
\ No newline at end of file
+
+def __getattr__(name):
+    # Deprecated alias, served only on explicit access (exceptions.BaseException / from-import):
+    # the old module-level name shadowed the builtin BaseException for importers. Use HLAException.
+    if name == "BaseException":
+        warnings.warn("libsrc.rtiUtil.exceptions.BaseException is deprecated; use HLAException",
+                      DeprecationWarning, stacklevel=2)
+        return HLAException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
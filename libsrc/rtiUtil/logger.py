@@ -17,6 +17,10 @@ class Colors:
     RESET = "\033[0m"
 
 _default_log_file_path_holder: list[Optional[str]] = [None]
+# Debug output is off unless enabled; hot paths check debug_enabled() before formatting messages
+_debug_enabled_holder: list[bool] = [False]
+# Message kinds ("incoming", "outgoing", ...) whose output is currently dropped
+_silenced_kinds_holder: list[set[str]] = [set()]
 
 def set_log_file_path(path: Optional[str]) -> None:
     """
@@ -31,6 +35,62 @@ def set_log_file_path(path: Optional[str]) -> None:
     """
     _default_log_file_path_holder[0] = path
 
+def set_debug_enabled(enabled: bool) -> None:
+    """
+        Description:
+            Globally enable or disable log_debug output.
+        Inputs:
+            enabled (bool): True to emit debug messages, False to drop them.
+        Outputs:
+            None
+        Exceptions:
+            None
+    """
+    _debug_enabled_holder[0] = enabled
+
+def debug_enabled() -> bool:
+    """
+        Description:
+            Report whether log_debug output is enabled; use to skip building costly debug messages.
+        Inputs:
+            None
+        Outputs:
+            bool: Current debug flag.
+        Exceptions:
+            None
+    """
+    return _debug_enabled_holder[0]
+
+def set_log_kind_enabled(kind: str, enabled: bool) -> None:
+    """
+        Description:
+            Enable or silence one message kind (e.g. "incoming" for per-callback chatter) globally.
+        Inputs:
+            kind (str): Message kind as used by log_and_print (outgoing, incoming, error, warning, info, debug).
+            enabled (bool): False to drop messages of that kind, True to emit them again.
+        Outputs:
+            None
+        Exceptions:
+            None
+    """
+    if enabled:
+        _silenced_kinds_holder[0].discard(kind)
+    else:
+        _silenced_kinds_holder[0].add(kind)
+
+def log_kind_enabled(kind: str) -> bool:
+    """
+        Description:
+            Report whether messages of a kind are currently emitted.
+        Inputs:
+            kind (str): Message kind.
+        Outputs:
+            bool: False if the kind has been silenced.
+        Exceptions:
+            None
+    """
+    return kind not in _silenced_kinds_holder[0]
+
 def _write_file(message: str, log_file_path: Optional[str]) -> None:
     """
         Description:
@@ -54,12 +114,13 @@ def _write_file(message: str, log_file_path: Optional[str]) -> None:
         # Avoid raising from logging
         pass
 
-def log_and_print(message: Any, kind: str = "info", log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_and_print(message: Any, *args: Any, kind: str = "info", log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Core logging function performing colored console print and optional file logging.
         Inputs:
-            message (Any): Object to be stringified and logged.
+            message (Any): Object to be stringified and logged, or a %-style format string when args are given.
+            args (Any): Optional format arguments; formatting is skipped entirely when kind is silenced.
             kind (str): Category controlling color (outgoing, incoming, error, warning, info).
             log_to_file (bool): If True, persist line to file (using provided or default path).
             log_file_path (Optional[str]): Per-call path override.
@@ -74,9 +135,12 @@ def log_and_print(message: Any, kind: str = "info", log_to_file: bool = False, l
         "error": Colors.RED,
         "warning": Colors.ORANGE,
         "info": Colors.WHITE,
+        "debug": Colors.WHITE,
     }
+    if kind in _silenced_kinds_holder[0]:
+        return
     color = color_map.get(kind, Colors.WHITE)
-    text = str(message)
+    text = (message % args) if args else str(message)
     try:
         # Console output with ANSI colors
         print(f"{color}{text}{Colors.RESET}")
@@ -84,12 +148,13 @@ def log_and_print(message: Any, kind: str = "info", log_to_file: bool = False, l
         if log_to_file:
             _write_file(text, log_file_path)
 
-def log_outgoing(message: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_outgoing(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Log an outgoing (sent) message in blue.
         Inputs:
             message (Any): Content to log.
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
             log_to_file (bool): Whether to append to file.
             log_file_path (Optional[str]): Optional per-call path.
         Outputs:
@@ -97,14 +162,15 @@ def log_outgoing(message: Any, log_to_file: bool = False, log_file_path: Optiona
         Exceptions:
             Same as log_and_print.
     """
-    log_and_print(message, kind="outgoing", log_to_file=log_to_file, log_file_path=log_file_path)
+    log_and_print(message, *args, kind="outgoing", log_to_file=log_to_file, log_file_path=log_file_path)
 
-def log_incoming(message: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_incoming(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Log an incoming (received) message in green.
         Inputs:
             message (Any)
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
             log_to_file (bool)
             log_file_path (Optional[str])
         Outputs:
@@ -112,14 +178,15 @@ def log_incoming(message: Any, log_to_file: bool = False, log_file_path: Optiona
         Exceptions:
             Same as log_and_print.
     """
-    log_and_print(message, kind="incoming", log_to_file=log_to_file, log_file_path=log_file_path)
+    log_and_print(message, *args, kind="incoming", log_to_file=log_to_file, log_file_path=log_file_path)
 
-def log_error(message: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_error(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Log an error message in red.
         Inputs:
             message (Any)
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
             log_to_file (bool)
             log_file_path (Optional[str])
         Outputs:
@@ -127,14 +194,15 @@ def log_error(message: Any, log_to_file: bool = False, log_file_path: Optional[s
         Exceptions:
             Same as log_and_print.
     """
-    log_and_print(message, kind="error", log_to_file=log_to_file, log_file_path=log_file_path)
+    log_and_print(message, *args, kind="error", log_to_file=log_to_file, log_file_path=log_file_path)
 
-def log_warning(message: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_warning(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Log a warning message in orange.
         Inputs:
             message (Any)
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
             log_to_file (bool)
             log_file_path (Optional[str])
         Outputs:
@@ -142,14 +210,31 @@ def log_warning(message: Any, log_to_file: bool = False, log_file_path: Optional
         Exceptions:
             Same as log_and_print.
     """
-    log_and_print(message, kind="warning", log_to_file=log_to_file, log_file_path=log_file_path)
+    log_and_print(message, *args, kind="warning", log_to_file=log_to_file, log_file_path=log_file_path)
 
-def log_info(message: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+def log_info(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
     """
         Description:
             Log an informational message in white.
         Inputs:
             message (Any)
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
+            log_to_file (bool)
+            log_file_path (Optional[str])
+        Outputs:
+            None
+        Exceptions:
+            Same as log_and_print.
+    """
+    log_and_print(message, *args, kind="info", log_to_file=log_to_file, log_file_path=log_file_path)
+
+def log_debug(message: Any, *args: Any, log_to_file: bool = False, log_file_path: Optional[str] = None) -> None:
+    """
+        Description:
+            Log a debug message in white; dropped unless enabled via set_debug_enabled(True).
+        Inputs:
+            message (Any)
+            args (Any): Optional %-style format arguments, applied only if the message is emitted.
             log_to_file (bool)
             log_file_path (Optional[str])
         Outputs:
@@ -157,4 +242,6 @@ def log_info(message: Any, log_to_file: bool = False, log_file_path: Optional[st
         Exceptions:
             Same as log_and_print.
     """
-    log_and_print(message, kind="info", log_to_file=log_to_file, log_file_path=log_file_path)
+    if not _debug_enabled_holder[0]:
+        return
+    log_and_print(message, *args, kind="debug", log_to_file=log_to_file, log_file_path=log_file_path)
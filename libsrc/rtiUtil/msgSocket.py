@@ -3,7 +3,7 @@
     To view a copy of this license, visit https://creativecommons.org/licenses/by-nd/4.0/
 """
 from os import error
-import struct, socket
+import socket
 from libsrc.rtiUtil.logger import *
 from libsrc.rtiUtil import exceptions
 from libsrc.fedPro import fedProMessage
@@ -113,7 +113,7 @@ class MsgSocket:
         aState = "Socket State:\n"
         aState += "  State: {}\n".format(self.state())
         errCatch = self.last_error()
-        if (errCatch is not ""):
+        if (errCatch != ""):
             aState += "  Last Error: {}\n".format(errCatch)
 
     def last_error(self):
@@ -200,7 +200,7 @@ class MsgSocket:
             if self.fillBuffer(chomp):
                 # If we have less that 3 segments of reveived data in the buf, this is the first pass of the loop
                 if len(self.my_recv_buffer) < 3:
-                    msg_length : int = struct.unpack(">I", self.my_recv_buffer[0])[0]
+                    msg_length : int = fedProMessage.UINT32_STRUCT.unpack(self.my_recv_buffer[0])[0]
                     #is checking for a minimum message length enough of a check?
                     if msg_length >= 24:
                         # try to grab the rest of the message